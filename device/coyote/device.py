@@ -313,12 +313,13 @@ class CoyoteDevice(OutputDevice, QObject):
             else:
                 # sequence_number > 0 means this is a response to our command
                 # Only log at debug level to avoid console spam while moving sliders
-                logger.debug(f"{LOG_PREFIX} Power level confirmed (seq={sequence_number}) - Channel A: {power_a}, Channel B: {power_b}")
+                logger.debug("%s Power level confirmed (seq=%d) - Channel A: %d, Channel B: %d",
+                             LOG_PREFIX, sequence_number, power_a, power_b)
                 # Don't update self.strengths or emit signal - the UI already tracks the desired value
                 # This prevents slider jumping caused by confirmation latency
 
         elif command_id == CMD_ACK:
-            logger.debug(f"{LOG_PREFIX} Command acknowledged (seq={sequence_number})")
+            logger.debug("%s Command acknowledged (seq=%d)", LOG_PREFIX, sequence_number)
 
         elif command_id == CMD_ACTIVE_POWER:
             if len(data) < 4:
@@ -1,13 +1,14 @@
 import logging
 import math
+from collections import deque
+from enum import Enum
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 
 from device.coyote.algorithm import CoyoteAlgorithm
 from device.coyote.common import clamp, normalize
 from device.coyote.constants import (
-    HARDWARE_MIN_FREQ_HZ, HARDWARE_MAX_FREQ_HZ,
-    MIN_PULSE_DURATION_MS, MAX_PULSE_DURATION_MS
+    HARDWARE_MIN_FREQ_HZ, HARDWARE_MAX_FREQ_HZ, PULSES_PER_PACKET
 )
 from device.coyote.types import CoyotePulse, CoyotePulses
 from stim_math.axis import AbstractAxis, AbstractTimestampMapper, LinearInterpolator
@@ -17,6 +18,25 @@ from qt_ui import settings
 logger = logging.getLogger("restim.coyote.motion")
 
 
+class FrequencyAlgorithm(Enum):
+    FIXED = 0
+    POSITION = 1
+    VARIED = 2
+    BLEND = 3
+
+    @staticmethod
+    def from_setting(value) -> 'FrequencyAlgorithm':
+        """Resolve a setting value, including display names like "Blend (Position + Noise)"."""
+        algo_str = str(value).upper() if value else "FIXED"
+        if "BLEND" in algo_str:
+            return FrequencyAlgorithm.BLEND
+        if "POSITION" in algo_str:
+            return FrequencyAlgorithm.POSITION
+        if "VARIED" in algo_str or "NOISE" in algo_str:
+            return FrequencyAlgorithm.VARIED
+        return FrequencyAlgorithm.FIXED  # FIXED or unknown
+
+
 class CoyoteMotionAlgorithm(CoyoteAlgorithm):
     """Motion Algorithm with enhanced funscript conversion for Coyote devices"""
 
@@ -32,23 +52,55 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         self.motion_params = params
         self.timestamp_mapper = timestamp_mapper
 
+        # External volume axis used for the UI display (green bar), if it is writable.
+        # Resolved once here instead of probing it with hasattr() on every packet.
+        external_volume = params.volume.external
+        self._external_volume = external_volume if hasattr(external_volume, 'add') else None
+        self._last_pushed_dyn_vol = float('nan')
+        self._last_push_time = float('-inf')
+
         # Motion Algorithm specific state
         self.velocity_history = []
         self.acceleration_history = []
         self.time_history = []
 
         # Dynamic volume state - velocity and stroke tracking for section intensity
-        self.dynamic_velocity_history = []  # List of (timestamp, velocity) tuples
+        self.dynamic_velocity_history = deque()  # (timestamp, velocity) tuples, oldest first
+        self._dynamic_velocity_sum = 0.0  # Running sum of velocities in dynamic_velocity_history
         self.last_velocity_sign = 0  # For detecting direction changes
-        self.direction_change_times = []  # Timestamps of direction changes (strokes)
+        self.direction_change_times = deque()  # Timestamps of direction changes (strokes), oldest first
 
         # Auto-calibrated values from funscript
         self.calibrated_max_speed = 5.0  # Default, will be updated from funscript
         self.calibrated_max_magnitude = 80.0  # Default, will be updated from funscript
         self.calibrated_max_stroke_rate = 2.0  # Max strokes per second, updated from funscript
+        self._last_calibration_timeframe = None  # Velocity timeframe used for the last calibration
+
+        # Frequency algorithm setting value and its resolved enum, re-resolved only when it changes
+        self._freq_algorithm_setting = None
+        self._freq_algorithm = FrequencyAlgorithm.FIXED
+
+        # Last system time -> video time mapping (see _map_to_video_time)
+        self._video_time_key = None
+        self._video_time_value = 0.0
+
+        # Last frequency noise sample as (time, value); shared by both channels
+        self._noise_sample = (None, 0.0)
 
         # Current dynamic volume (updated each pulse, used for both output and UI)
         self.current_dynamic_volume = 1.0
+        self._dyn_vol_last_recalc = float('-inf')
+
+        # Last _positional_intensity result, keyed on (time in ms, volume in 0.1%)
+        self._positional_intensity_key = None
+        self._positional_intensity_value = (0, 0)
+
+        # Last api * master volume and the time it was sampled at (see _get_standard_volume_at_time)
+        self._standard_volume_time = float('-inf')
+        self._standard_volume = 1.0
+
+        # Total (A, B) duration in ms of the last packet built by _generate_motion_pulses
+        self._packet_durations_ms = (0, 0)
 
         # Real-time velocity tracking for accurate movement detection
         self._prev_position = None
@@ -60,31 +112,55 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         self._last_fade_time = None
         self._is_moving = False
 
+        # Throttle timestamps for the periodic INFO logs (-inf so the first call logs)
+        self._last_debug_log = float('-inf')
+        self._last_calc_log = float('-inf')
+        self._last_avg_vel_log = float('-inf')
+        self._last_dyn_vol_log = float('-inf')
+        self._last_amp_log_time = float('-inf')
+        self._last_freq_log = float('-inf')
+        self._last_total_vol_log = float('-inf')
+        self._last_vol_log_time = float('-inf')
+
         # Regional throbbing - track position history to detect confined strokes
-        self._position_history = []  # List of (timestamp, position) tuples
+        self._position_history = deque()  # (timestamp, position) tuples, oldest first
         self._position_history_window = 0.5  # Time window in seconds to track positions
 
+        # Channel frequency bounds are constant axes, so resolve them once
+        self._cache_frequency_bounds()
+
         # Precompute velocity and acceleration for better performance
         self._precompute_motion_data()
-        
+
+    def _cache_frequency_bounds(self):
+        """Resolve per-channel (min, max) frequency from the channel params.
+
+        The bounds are constant axes built from settings when the algorithm is
+        created, so this avoids four interpolate() calls per packet. Call again
+        if the channel params are replaced.
+        """
+        self._freq_bounds_a = (float(self.motion_params.channel_a.minimum_frequency.interpolate(0.0)),
+                               float(self.motion_params.channel_a.maximum_frequency.interpolate(0.0)))
+        self._freq_bounds_b = (float(self.motion_params.channel_b.minimum_frequency.interpolate(0.0)),
+                               float(self.motion_params.channel_b.maximum_frequency.interpolate(0.0)))
+
     def _precompute_motion_data(self):
         """Precompute velocity and acceleration from funscript data"""
         # Get position data from alpha axis (funscript)
         alpha_axis = self.motion_params.position.alpha
-        logger.info(f"Motion Algorithm: Checking alpha axis type: {type(alpha_axis).__name__}")
+        logger.info("Motion Algorithm: Checking alpha axis type: %s", type(alpha_axis).__name__)
 
         if hasattr(alpha_axis, 'timeline'):
             positions = alpha_axis.timeline.y()
             times = alpha_axis.timeline.x()
-            logger.info(f"Motion Algorithm: Found timeline with {len(positions)} position points")
+            logger.info("Motion Algorithm: Found timeline with %d position points", len(positions))
 
             # Check if we have enough data to compute gradients
             if len(positions) < 2 or len(times) < 2:
                 # No funscript data - use defaults
                 logger.warning("Motion Algorithm: Funscript has less than 2 points, using defaults")
-                self.position_data = [(0.0, 0.5)]
-                self.velocity_data = [(0.0, 0.0)]
-                self.acceleration_data = [(0.0, 0.0)]
+                self._set_default_motion_data()
+                self._store_stroke_data([])
                 return
 
             # Calculate velocity using numpy gradient
@@ -93,13 +169,22 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
             # Calculate acceleration using gradient of velocity
             accelerations = np.gradient(velocities, times)
 
-            # Store for quick lookup
+            # Cache as contiguous float64 arrays so per-pulse lookups never copy or convert.
+            # Timeline columns may be strided views, and float32 would be upcast again by
+            # np.searchsorted/np.interp against float64 query times.
+            self._times_np = np.ascontiguousarray(times, dtype=np.float64)
+            self._positions_np = np.ascontiguousarray(positions, dtype=np.float64)
+            self._velocities_np = np.ascontiguousarray(velocities, dtype=np.float64)
+            self._accelerations_np = np.ascontiguousarray(accelerations, dtype=np.float64)
+            self._build_motion_table()
+
+            # List-of-tuples views kept for callers that inspect the raw data
             self.position_data = list(zip(times, positions))
             self.velocity_data = list(zip(times, velocities))
             self.acceleration_data = list(zip(times, accelerations))
 
-            logger.info(f"Motion Algorithm: Loaded funscript with {len(self.position_data)} points, "
-                       f"time range: {times[0]:.2f}s - {times[-1]:.2f}s")
+            logger.info("Motion Algorithm: Loaded funscript with %d points, time range: %.2fs - %.2fs",
+                        len(self.position_data), times[0], times[-1])
 
             # Detect strokes (direction changes) and calculate stroke-based velocities
             # This measures velocity based on stroke endpoints rather than individual keyframes,
@@ -116,20 +201,55 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
 
             magnitudes = np.abs(accelerations)
             self.calibrated_max_magnitude = max(np.percentile(magnitudes, 95), 5.0)  # At least 5.0
-            logger.info(f"Motion Algorithm: Auto-calibrated from funscript: "
-                       f"max_speed={self.calibrated_max_speed:.2f} (from {len(self.stroke_data)} strokes), "
-                       f"max_magnitude={self.calibrated_max_magnitude:.2f}")
+            logger.info("Motion Algorithm: Auto-calibrated from funscript: "
+                        "max_speed=%.2f (from %d strokes), max_magnitude=%.2f",
+                        self.calibrated_max_speed, len(self.stroke_data), self.calibrated_max_magnitude)
 
             # Calculate min/max amplitude across the entire funscript for dynamic volume normalization
             self._precompute_amplitude_range()
         else:
             # No timeline data - use defaults
-            logger.warning(f"Motion Algorithm: No funscript loaded (axis has no 'timeline' attribute). "
-                          f"Load a funscript mapped to Position Alpha for motion output.")
-            self.position_data = [(0.0, 0.5)]
-            self.velocity_data = [(0.0, 0.0)]
-            self.acceleration_data = [(0.0, 0.0)]
-            self.stroke_data = []
+            logger.warning("Motion Algorithm: No funscript loaded (axis has no 'timeline' attribute). "
+                           "Load a funscript mapped to Position Alpha for motion output.")
+            self._set_default_motion_data()
+            self._store_stroke_data([])
+
+    def _set_default_motion_data(self):
+        """Single neutral sample used when no usable funscript is loaded"""
+        self._times_np = np.zeros(1, dtype=np.float64)
+        self._positions_np = np.full(1, 0.5, dtype=np.float64)
+        self._velocities_np = np.zeros(1, dtype=np.float64)
+        self._accelerations_np = np.zeros(1, dtype=np.float64)
+        self._build_motion_table()
+
+        self.position_data = [(0.0, 0.5)]
+        self.velocity_data = [(0.0, 0.0)]
+        self.acceleration_data = [(0.0, 0.0)]
+
+    def _build_motion_table(self):
+        """Stack position/velocity/acceleration into one (N, 3) table.
+
+        All three share the same time axis, so a single binary search finds the
+        interpolation rows for every component and both rows sit next to each other.
+        """
+        self._motion_table = np.column_stack((self._positions_np, self._velocities_np, self._accelerations_np))
+
+    def _interpolate_motion(self, video_time: float) -> np.ndarray:
+        """Linearly interpolate (position, velocity, acceleration) at video_time.
+
+        Matches np.interp: values are held constant outside the funscript range.
+        """
+        times = self._times_np
+        table = self._motion_table
+        if video_time <= times[0]:
+            return table[0]
+        if video_time >= times[-1]:
+            return table[-1]
+
+        # times[i] <= video_time < times[i + 1], so the interval is never empty
+        i = np.searchsorted(times, video_time, side='right') - 1
+        w = (video_time - times[i]) / (times[i + 1] - times[i])
+        return table[i] + (table[i + 1] - table[i]) * w
 
     def _precompute_stroke_data(self, positions: np.ndarray, times: np.ndarray):
         """Detect strokes (direction changes) and calculate stroke-based velocities.
@@ -148,62 +268,64 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
             (start_time, end_time, start_pos, end_pos, stroke_velocity)
         """
         if len(positions) < 2:
-            self.stroke_data = []
+            self._store_stroke_data([])
             return
 
-        strokes = []
-        stroke_start_idx = 0
-        last_direction = 0  # 0 = unknown, 1 = up, -1 = down
-
         # Small threshold to ignore noise/micro-movements
         direction_threshold = 0.001
 
-        for i in range(1, len(positions)):
-            pos_delta = positions[i] - positions[i - 1]
-
-            # Determine current direction
-            if pos_delta > direction_threshold:
-                current_direction = 1  # moving up
-            elif pos_delta < -direction_threshold:
-                current_direction = -1  # moving down
-            else:
-                current_direction = last_direction  # no significant movement, keep previous
-
-            # Check for direction change
-            if last_direction != 0 and current_direction != 0 and current_direction != last_direction:
-                # Direction changed - record the stroke that just ended
-                stroke_end_idx = i - 1
-
-                start_time = times[stroke_start_idx]
-                end_time = times[stroke_end_idx]
-                start_pos = positions[stroke_start_idx]
-                end_pos = positions[stroke_end_idx]
-
-                time_delta = end_time - start_time
-                if time_delta > 0.001:  # Avoid division by near-zero
-                    stroke_velocity = abs(end_pos - start_pos) / time_delta
-                    strokes.append((start_time, end_time, start_pos, end_pos, stroke_velocity))
-
-                # Start new stroke from the direction change point
-                stroke_start_idx = stroke_end_idx
-
-            if current_direction != 0:
-                last_direction = current_direction
-
-        # Don't forget the final stroke (from last direction change to end)
-        if stroke_start_idx < len(positions) - 1:
-            start_time = times[stroke_start_idx]
-            end_time = times[-1]
-            start_pos = positions[stroke_start_idx]
-            end_pos = positions[-1]
+        times = np.asarray(times, dtype=np.float64)
+        positions = np.asarray(positions, dtype=np.float64)
+
+        # Classify every keyframe step at once: 1 = moving up, -1 = moving down,
+        # 0 = no significant movement, which keeps the previous direction
+        pos_deltas = np.diff(positions)
+        step_directions = np.where(pos_deltas > direction_threshold, 1,
+                                   np.where(pos_deltas < -direction_threshold, -1, 0)).astype(np.int8)
+        last_significant = np.maximum.accumulate(
+            np.where(step_directions != 0, np.arange(len(step_directions)), -1))
+        directions = np.where(last_significant >= 0, step_directions[last_significant], 0)
+
+        # A stroke ends at the keyframe before the direction reverses. The next
+        # stroke starts from that same keyframe, and the last one runs to the end.
+        reversals = np.flatnonzero((directions[:-1] != 0) & (directions[1:] != directions[:-1])) + 1
+        boundaries = np.concatenate(([0], reversals, [len(positions) - 1]))
+        start_idx = boundaries[:-1]
+        end_idx = boundaries[1:]
+
+        time_deltas = times[end_idx] - times[start_idx]
+        valid = time_deltas > 0.001  # Avoid division by near-zero
+        start_idx = start_idx[valid]
+        end_idx = end_idx[valid]
+        stroke_velocities = np.abs(positions[end_idx] - positions[start_idx]) / time_deltas[valid]
+
+        strokes = list(zip(times[start_idx].tolist(), times[end_idx].tolist(),
+                           positions[start_idx].tolist(), positions[end_idx].tolist(),
+                           stroke_velocities.tolist()))
+        self._store_stroke_data(strokes)
+        logger.info("Motion Algorithm: Detected %d strokes from %d keyframes", len(strokes), len(positions))
+
+    def _store_stroke_data(self, strokes: list):
+        """Store detected strokes, plus column arrays for windowed lookups.
+
+        Strokes are contiguous and in time order, so both start and end times
+        are sorted and a window overlap query reduces to two binary searches.
+        """
+        self.stroke_data = strokes
+        self._stroke_starts_np = np.array([s[0] for s in strokes], dtype=np.float64)
+        self._stroke_ends_np = np.array([s[1] for s in strokes], dtype=np.float64)
+        velocities = np.array([s[4] for s in strokes], dtype=np.float64)  # always >= 0
+        # Prefix sum so the velocity sum over strokes [lo, hi) is csum[hi] - csum[lo]
+        self._stroke_velocity_csum = np.concatenate(([0.0], np.cumsum(velocities)))
 
-            time_delta = end_time - start_time
-            if time_delta > 0.001:
-                stroke_velocity = abs(end_pos - start_pos) / time_delta
-                strokes.append((start_time, end_time, start_pos, end_pos, stroke_velocity))
+    def _stroke_window_bounds(self, window_start, window_end):
+        """Index range [lo, hi) of strokes whose time range overlaps [window_start, window_end].
 
-        self.stroke_data = strokes
-        logger.info(f"Motion Algorithm: Detected {len(strokes)} strokes from {len(positions)} keyframes")
+        Accepts scalars or arrays of window bounds.
+        """
+        lo = np.searchsorted(self._stroke_ends_np, window_start, side='left')
+        hi = np.searchsorted(self._stroke_starts_np, window_end, side='right')
+        return lo, hi
 
     def _get_stroke_velocity_at_time(self, video_time: float) -> float:
         """Get the stroke velocity for the stroke containing the given time.
@@ -211,13 +333,14 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         Returns the velocity of the stroke that the given time falls within.
         If time is between strokes, returns the velocity of the nearest stroke.
         """
-        if not hasattr(self, 'stroke_data') or not self.stroke_data:
+        if not self.stroke_data:
             return 0.0
 
-        # Find stroke containing this time
-        for start_time, end_time, start_pos, end_pos, velocity in self.stroke_data:
-            if start_time <= video_time <= end_time:
-                return velocity
+        # Find the first stroke containing this time: the first stroke ending at or
+        # after video_time, provided it has already started
+        idx = np.searchsorted(self._stroke_ends_np, video_time, side='left')
+        if idx < len(self.stroke_data) and self._stroke_starts_np[idx] <= video_time:
+            return self.stroke_data[idx][4]
 
         # Time is outside all strokes - find nearest
         if video_time < self.stroke_data[0][0]:
@@ -235,11 +358,11 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         self._recalibrate_velocity_range()
 
         # Calculate stroke rate from stroke_data (each stroke is a direction change)
-        times = [p[0] for p in self.position_data]
+        times = self._times_np
         time_span = times[-1] - times[0] if len(times) > 1 else 1.0
 
         # Number of strokes equals number of direction changes
-        stroke_count = len(self.stroke_data) if hasattr(self, 'stroke_data') else 0
+        stroke_count = len(self.stroke_data)
         avg_stroke_rate = stroke_count / time_span if time_span > 0 else 1.0
         self.calibrated_max_stroke_rate = max(avg_stroke_rate * 1.5, 1.0)
 
@@ -251,63 +374,56 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
 
         Called automatically when timeframe changes, or can be called manually.
         """
-        if not hasattr(self, 'stroke_data') or len(self.stroke_data) < 2:
+        timeframe = settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.get()
+
+        if len(self.stroke_data) < 2:
             self.calibrated_max_speed = 0.5
-            self._last_calibration_timeframe = settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.get()
+            self._last_calibration_timeframe = timeframe
             return
 
-        times = [p[0] for p in self.position_data]
+        times = self._times_np
         time_span = times[-1] - times[0] if len(times) > 1 else 1.0
 
         # Use the same timeframe as the user's velocity factor setting
-        calibration_window = settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.get()
+        calibration_window = timeframe
         # Ensure window isn't larger than 1/4 of total funscript length
         calibration_window = min(calibration_window, time_span / 4) if time_span > 0 else 5.0
 
         # Store the timeframe used for this calibration
-        self._last_calibration_timeframe = settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.get()
+        self._last_calibration_timeframe = timeframe
 
         # Scan the funscript with sliding windows to find max average stroke velocity
-        window_averages = []
         step_size = calibration_window / 2  # 50% overlap
+        window_count = int(np.floor((times[-1] - times[0]) / step_size)) + 1
+        centers = times[0] + step_size * np.arange(window_count)
 
-        current_time = times[0]
-        while current_time <= times[-1]:
-            window_start = current_time - calibration_window / 2
-            window_end = current_time + calibration_window / 2
-
-            # Get stroke velocities for strokes that overlap with this window
-            # A stroke overlaps if its time range intersects with the window
-            velocities_in_window = [
-                stroke[4]  # stroke velocity
-                for stroke in self.stroke_data
-                if stroke[0] <= window_end and stroke[1] >= window_start  # overlap check
-            ]
-
-            if velocities_in_window:
-                window_avg = sum(velocities_in_window) / len(velocities_in_window)
-                window_averages.append(window_avg)
-
-            current_time += step_size
+        # Average velocity of strokes that overlap with each window, from the prefix sum
+        lo, hi = self._stroke_window_bounds(centers - calibration_window / 2, centers + calibration_window / 2)
+        counts = hi - lo
+        has_strokes = counts > 0
+        window_sums = self._stroke_velocity_csum[hi] - self._stroke_velocity_csum[lo]
+        window_averages = window_sums[has_strokes] / counts[has_strokes]
 
         # Use 95th percentile of window averages as the calibrated max
         # This represents the "most intense sections" without being skewed by single spikes
-        if window_averages:
+        if window_averages.size:
             self.calibrated_max_speed = max(np.percentile(window_averages, 95), 0.5)
         else:
             self.calibrated_max_speed = 0.5
 
-        logger.info(f"Motion Algorithm: Recalibrated with timeframe={calibration_window:.1f}s, "
-                   f"{len(window_averages)} windows, {len(self.stroke_data)} strokes, "
-                   f"max_avg_speed={self.calibrated_max_speed:.2f}")
+        logger.info("Motion Algorithm: Recalibrated with timeframe=%.1fs, %d windows, %d strokes, "
+                    "max_avg_speed=%.2f",
+                    calibration_window, len(window_averages), len(self.stroke_data),
+                    self.calibrated_max_speed)
 
     def _check_recalibration_needed(self):
         """Check if timeframe changed and recalibrate if needed."""
         current_timeframe = settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.get()
-        last_timeframe = getattr(self, '_last_calibration_timeframe', None)
+        last_timeframe = self._last_calibration_timeframe
 
         if last_timeframe is None or current_timeframe != last_timeframe:
-            logger.info(f"Motion Algorithm: Timeframe changed from {last_timeframe} to {current_timeframe}, recalibrating...")
+            logger.info("Motion Algorithm: Timeframe changed from %s to %s, recalibrating...",
+                        last_timeframe, current_timeframe)
             self._recalibrate_velocity_range()
 
     def _get_average_velocity_in_window(self, current_time: float) -> float:
@@ -328,14 +444,7 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         self._check_recalibration_needed()
 
         # Map system time to video time (same as _get_position_velocity_acceleration)
-        video_time = current_time
-        if self.timestamp_mapper is not None:
-            try:
-                mapped_time = self.timestamp_mapper.map_timestamp(current_time)
-                if mapped_time is not None and mapped_time >= 0:
-                    video_time = mapped_time
-            except Exception as e:
-                logger.debug(f"Timestamp mapping failed in velocity window: {e}")
+        video_time = self._map_to_video_time(current_time)
 
         timeframe = settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.get()
         half_window = timeframe / 2.0
@@ -343,26 +452,22 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         window_start = video_time - half_window
         window_end = video_time + half_window
 
-        # Get stroke velocities for strokes that overlap with this window
-        # A stroke overlaps if its time range intersects with the window
-        velocities_in_window = [
-            stroke[4]  # stroke velocity
-            for stroke in self.stroke_data
-            if stroke[0] <= window_end and stroke[1] >= window_start  # overlap check
-        ]
+        # Average velocity of strokes that overlap with this window, from the prefix sum
+        lo, hi = self._stroke_window_bounds(window_start, window_end)
+        stroke_count = int(hi - lo)
 
-        if not velocities_in_window:
+        if stroke_count == 0:
             # Fallback to 0 if no strokes in window (edge of funscript)
             return 0.0
 
-        avg_velocity = sum(velocities_in_window) / len(velocities_in_window)
+        avg_velocity = float(self._stroke_velocity_csum[hi] - self._stroke_velocity_csum[lo]) / stroke_count
 
         # Log average velocity (occasionally, to avoid spam)
-        if not hasattr(self, '_last_avg_vel_log') or current_time - getattr(self, '_last_avg_vel_log', 0) > 2.0:
+        if logger.isEnabledFor(logging.INFO) and current_time - self._last_avg_vel_log > 2.0:
             self._last_avg_vel_log = current_time
-            logger.info(f"  AVG STROKE VEL: window=[{window_start:.1f}s, {window_end:.1f}s], "
-                       f"strokes={len(velocities_in_window)}, avg={avg_velocity:.3f}, "
-                       f"global_max={self.calibrated_max_speed:.3f}")
+            logger.info("  AVG STROKE VEL: window=[%.1fs, %.1fs], strokes=%d, avg=%.3f, global_max=%.3f",
+                        window_start, window_end, stroke_count, avg_velocity,
+                        self.calibrated_max_speed)
 
         return avg_velocity
 
@@ -384,20 +489,15 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         base_volume = settings.COYOTE_MOTION_BASE_VOLUME.get()
 
         # Map system time to video time for stroke lookup
-        video_time = current_time
-        if self.timestamp_mapper is not None:
-            try:
-                mapped_time = self.timestamp_mapper.map_timestamp(current_time)
-                if mapped_time is not None and mapped_time >= 0:
-                    video_time = mapped_time
-            except Exception:
-                pass
+        video_time = self._map_to_video_time(current_time)
 
         # Get stroke velocity at current time (independent of keyframe density)
         stroke_velocity = self._get_stroke_velocity_at_time(video_time)
 
-        # Track stroke velocity history (using stroke velocity, not keyframe velocity)
+        # Track stroke velocity history (using stroke velocity, not keyframe velocity).
+        # Stroke velocities are magnitudes already, so no abs() is needed downstream.
         self.dynamic_velocity_history.append((current_time, stroke_velocity))
+        self._dynamic_velocity_sum += stroke_velocity
 
         # Detect direction changes using instantaneous velocity sign
         # (This is still valid - we're just detecting up vs down movement)
@@ -407,27 +507,26 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         if current_sign != 0:
             self.last_velocity_sign = current_sign
 
-        # Prune old entries outside the time window
+        # Prune old entries outside the time window (entries are appended in time order)
         cutoff_time = current_time - window_size
-        self.dynamic_velocity_history = [(t, v) for t, v in self.dynamic_velocity_history if t >= cutoff_time]
-        self.direction_change_times = [t for t in self.direction_change_times if t >= cutoff_time]
-
-        # Calculate average stroke velocity over the window
-        if len(self.dynamic_velocity_history) > 0:
-            avg_velocity = sum(abs(v) for _, v in self.dynamic_velocity_history) / len(self.dynamic_velocity_history)
+        while self.dynamic_velocity_history and self.dynamic_velocity_history[0][0] < cutoff_time:
+            self._dynamic_velocity_sum -= self.dynamic_velocity_history.popleft()[1]
+        while self.direction_change_times and self.direction_change_times[0] < cutoff_time:
+            self.direction_change_times.popleft()
+
+        # Calculate average stroke velocity over the window from the running sum
+        if self.dynamic_velocity_history:
+            avg_velocity = max(self._dynamic_velocity_sum, 0.0) / len(self.dynamic_velocity_history)
         else:
-            avg_velocity = abs(stroke_velocity)
+            avg_velocity = stroke_velocity
 
         # Calculate stroke rate (direction changes per second)
         stroke_count = len(self.direction_change_times)
         stroke_rate = stroke_count / window_size if window_size > 0 else 0.0
 
         # Normalize both metrics against calibrated maximums
-        max_speed = getattr(self, 'calibrated_max_speed', 5.0)
-        max_stroke_rate = getattr(self, 'calibrated_max_stroke_rate', 2.0)
-
-        normalized_velocity = clamp(avg_velocity / max_speed, 0.0, 1.0)
-        normalized_stroke_rate = clamp(stroke_rate / max_stroke_rate, 0.0, 1.0)
+        normalized_velocity = clamp(avg_velocity / self.calibrated_max_speed, 0.0, 1.0)
+        normalized_stroke_rate = clamp(stroke_rate / self.calibrated_max_stroke_rate, 0.0, 1.0)
 
         # Combine velocity and stroke rate based on user-configurable mix ratio
         # mix_ratio: 0.0 = pure stroke count, 0.5 = balanced, 1.0 = pure velocity
@@ -445,22 +544,24 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         dynamic_volume = 1.0 - sensitivity * (1.0 - full_range_volume)
 
         # Log dynamic volume calculation (occasionally)
-        if not hasattr(self, '_last_dyn_vol_log') or current_time - getattr(self, '_last_dyn_vol_log', 0) > 2.0:
+        if logger.isEnabledFor(logging.INFO) and current_time - self._last_dyn_vol_log > 2.0:
             self._last_dyn_vol_log = current_time
-            logger.info(f"  DYN VOL: stroke_vel={stroke_velocity:.3f}, avg_vel={avg_velocity:.3f}, "
-                       f"stroke_rate={stroke_rate:.2f}/s, norm_vel={normalized_velocity:.2f}, "
-                       f"norm_stroke={normalized_stroke_rate:.2f}, mix={mix_ratio:.0%}, "
-                       f"intensity={intensity_metric:.2f}, dynamic_vol={dynamic_volume:.3f}")
+            logger.info("  DYN VOL: stroke_vel=%.3f, avg_vel=%.3f, stroke_rate=%.2f/s, norm_vel=%.2f, "
+                        "norm_stroke=%.2f, mix=%.0f%%, intensity=%.2f, dynamic_vol=%.3f",
+                        stroke_velocity, avg_velocity, stroke_rate, normalized_velocity,
+                        normalized_stroke_rate, mix_ratio * 100, intensity_metric, dynamic_volume)
 
         return dynamic_volume
 
-    def _get_position_velocity_acceleration(self, time: float):
-        """Get position, velocity, and acceleration at specific time"""
-        if not hasattr(self, 'position_data'):
-            self._precompute_motion_data()
+    def _map_to_video_time(self, time: float) -> float:
+        """Map system time to media playback position using the timestamp mapper.
+
+        Position, window velocity and dynamic volume all need the video time for the
+        same tick, so the last mapping is reused when asked for the same time again.
+        """
+        if time == self._video_time_key:
+            return self._video_time_value
 
-        # Map system time to video time using the timestamp mapper
-        # This converts current time (time.time()) to media playback position
         video_time = time
         if self.timestamp_mapper is not None:
             try:
@@ -469,21 +570,26 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
                 if mapped_time is not None and mapped_time >= 0:
                     video_time = mapped_time
             except Exception as e:
-                logger.debug(f"Timestamp mapping failed: {e}")
+                logger.debug("Timestamp mapping failed: %s", e)
+
+        self._video_time_key = time
+        self._video_time_value = video_time
+        return video_time
+
+    def _get_position_velocity_acceleration(self, time: float):
+        """Get position, velocity, and acceleration at specific time"""
+        # Map system time to video time using the timestamp mapper
+        # This converts current time (time.time()) to media playback position
+        video_time = self._map_to_video_time(time)
 
         # Linear interpolation for all three components using video time
-        pos = np.interp(video_time, [p[0] for p in self.position_data],
-                         [p[1] for p in self.position_data])
-        vel = np.interp(video_time, [v[0] for v in self.velocity_data],
-                         [v[1] for v in self.velocity_data])
-        acc = np.interp(video_time, [a[0] for a in self.acceleration_data],
-                         [a[1] for a in self.acceleration_data])
+        pos, vel, acc = self._interpolate_motion(video_time)
 
         # Logging (only occasionally to avoid spam) - use INFO level to ensure visibility
-        if not hasattr(self, '_last_debug_log') or time - self._last_debug_log > 1.0:
+        if logger.isEnabledFor(logging.INFO) and time - self._last_debug_log > 1.0:
             self._last_debug_log = time
-            logger.info(f"Motion data: video_time={video_time:.2f}s, pos={pos:.3f}, vel={vel:.3f}, acc={acc:.3f}, "
-                        f"data_points={len(self.position_data)}")
+            logger.info("Motion data: video_time=%.2fs, pos=%.3f, vel=%.3f, acc=%.3f, data_points=%d",
+                        video_time, pos, vel, acc, len(self._times_np))
 
         return pos, vel, acc
     
@@ -517,25 +623,27 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
             time_delta = current_time - self._last_fade_time
         self._last_fade_time = current_time
 
-        # Get fade settings
-        fade_out_time = settings.COYOTE_MOTION_FADE_OUT_TIME.get()
-        fade_in_time = settings.COYOTE_MOTION_FADE_IN_TIME.get()
-
-        # Update fade level based on movement state
+        # Update fade level based on movement state. Once the fade is saturated in the
+        # current direction (steady movement or a held pause) it cannot change, so the
+        # fade settings are only consulted while a transition is in progress.
         if is_moving:
             # Fade in when moving
-            if fade_in_time > 0 and time_delta > 0:
-                fade_rate = 1.0 / fade_in_time  # Full fade-in per fade_in_time seconds
-                self._fade_level = min(1.0, self._fade_level + fade_rate * time_delta)
-            else:
-                self._fade_level = 1.0
+            if self._fade_level < 1.0:
+                fade_in_time = settings.COYOTE_MOTION_FADE_IN_TIME.get()
+                if fade_in_time > 0 and time_delta > 0:
+                    fade_rate = 1.0 / fade_in_time  # Full fade-in per fade_in_time seconds
+                    self._fade_level = min(1.0, self._fade_level + fade_rate * time_delta)
+                else:
+                    self._fade_level = 1.0
         else:
             # Fade out when not moving
-            if fade_out_time > 0 and time_delta > 0:
-                fade_rate = 1.0 / fade_out_time  # Full fade-out per fade_out_time seconds
-                self._fade_level = max(0.0, self._fade_level - fade_rate * time_delta)
-            else:
-                self._fade_level = 0.0
+            if self._fade_level > 0.0:
+                fade_out_time = settings.COYOTE_MOTION_FADE_OUT_TIME.get()
+                if fade_out_time > 0 and time_delta > 0:
+                    fade_rate = 1.0 / fade_out_time  # Full fade-out per fade_out_time seconds
+                    self._fade_level = max(0.0, self._fade_level - fade_rate * time_delta)
+                else:
+                    self._fade_level = 0.0
 
         self._is_moving = is_moving
 
@@ -557,25 +665,19 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         amplitude = raw_amplitude * self._fade_level
 
         # Log amplitude calculation details (occasionally)
-        if not hasattr(self, '_last_amp_log_time') or (hasattr(self, '_last_amp_log_time') and
-            getattr(self, '_last_amp_log_time', 0) + 1.0 < getattr(self, '_last_debug_log', 0)):
-            self._last_amp_log_time = getattr(self, '_last_debug_log', 0)
-            logger.info(f"  AMP CALC: pos={normalized_pos:.3f}, moving={is_moving}, fade={self._fade_level:.2f}, "
-                       f"raw_amp={raw_amplitude:.3f}, final_amp={amplitude:.3f}")
+        if logger.isEnabledFor(logging.INFO) and self._last_amp_log_time + 1.0 < self._last_debug_log:
+            self._last_amp_log_time = self._last_debug_log
+            logger.info("  AMP CALC: pos=%.3f, moving=%s, fade=%.2f, raw_amp=%.3f, final_amp=%.3f",
+                        normalized_pos, is_moving, self._fade_level, raw_amplitude, amplitude)
 
         return clamp(amplitude, 0.0, 1.0)
     
     def _apply_positional_effect(self, amplitude: float, position: float) -> Tuple[float, float]:
         """Apply positional channel distribution (sqrt-based from Howl)"""
-        # Get user-defined positional effect strength
-        positional_strength = 1.0  # Could be made configurable
-
-        # Calculate effective position with user strength
-        effective_position = 0.5 * (1 - positional_strength) + position * positional_strength
-
-        # Square root distribution for smooth transitions
-        amplitude_a = amplitude * math.sqrt(1 - effective_position)
-        amplitude_b = amplitude * math.sqrt(effective_position)
+        # Square root distribution for smooth transitions (full positional strength,
+        # so the position is used directly). Keeps amplitude_a² + amplitude_b² == amplitude².
+        amplitude_a = amplitude * math.sqrt(1.0 - position)
+        amplitude_b = amplitude * math.sqrt(position)
 
         return amplitude_a, amplitude_b
 
@@ -607,7 +709,8 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
 
         # Prune old entries outside the time window
         cutoff_time = current_time - self._position_history_window
-        self._position_history = [(t, p) for t, p in self._position_history if t >= cutoff_time]
+        while self._position_history[0][0] < cutoff_time:
+            self._position_history.popleft()
 
         # Need enough history to determine stroke range
         if len(self._position_history) < 2:
@@ -646,7 +749,15 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         This method is called by the base CoyoteAlgorithm's channel controllers.
         Note: When using direct pulse generation via generate_packet override,
         this method is not used.
+
+        Each channel controller asks for both intensities and keeps its own, so the
+        last result is reused for queries within the same millisecond and volume step.
+        Intensities are whole percents, so the quantized key is well below their resolution.
         """
+        key = (int(time_s * 1000.0), int(volume * 1000.0))
+        if key == self._positional_intensity_key:
+            return self._positional_intensity_value
+
         # Get position, velocity, acceleration from funscript
         pos, vel, acc = self._get_position_velocity_acceleration(time_s)
 
@@ -654,7 +765,7 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         normalized_pos = clamp((pos + 1.0) / 2.0, 0.0, 1.0)
 
         # Calculate position-based amplitude (with velocity used only for movement detection)
-        motion_amplitude = self._calculate_motion_amplitude(normalized_pos, vel)
+        motion_amplitude = self._calculate_motion_amplitude(normalized_pos, vel, time_s)
 
         # Apply positional channel distribution
         channel_a_amp, channel_b_amp = self._apply_positional_effect(motion_amplitude, normalized_pos)
@@ -663,7 +774,9 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         intensity_a = int(channel_a_amp * volume * 100.0)
         intensity_b = int(channel_b_amp * volume * 100.0)
 
-        return clamp(intensity_a, 0, 100), clamp(intensity_b, 0, 100)
+        self._positional_intensity_key = key
+        self._positional_intensity_value = (clamp(intensity_a, 0, 100), clamp(intensity_b, 0, 100))
+        return self._positional_intensity_value
 
     def generate_packet(self, current_time: float) -> Optional[CoyotePulses]:
         """Override base class to use Motion Algorithm's direct pulse generation.
@@ -674,53 +787,39 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         # Generate pulses directly using Motion Algorithm logic
         pulses = self.get_pulses_at_time(current_time)
 
-        # Calculate packet duration for scheduling
-        duration_a = sum(p.duration for p in pulses.channel_a) if pulses.channel_a else 0
-        duration_b = sum(p.duration for p in pulses.channel_b) if pulses.channel_b else 0
+        # Packet durations for scheduling, recorded while the pulses were built
+        duration_a, duration_b = self._packet_durations_ms
 
         # Schedule next update at 65% of shortest packet duration (same as base class)
         min_duration_ms = max(1, min(duration_a, duration_b) if min(duration_a, duration_b) > 0 else max(duration_a, duration_b, 1))
         self.next_update_time = current_time + (min_duration_ms / 1000.0) * 0.65
 
         # Log packet info (use INFO level to ensure visibility)
-        if pulses.channel_a:
-            logger.info(f"Motion packet @ {current_time:.2f}s: "
-                       f"A=[{pulses.channel_a[0].intensity}% @ {pulses.channel_a[0].frequency}Hz], "
-                       f"B=[{pulses.channel_b[0].intensity}% @ {pulses.channel_b[0].frequency}Hz]")
+        if pulses.channel_a and logger.isEnabledFor(logging.INFO):
+            logger.info("Motion packet @ %.2fs: A=[%d%% @ %dHz], B=[%d%% @ %dHz]",
+                        current_time,
+                        pulses.channel_a[0].intensity, pulses.channel_a[0].frequency,
+                        pulses.channel_b[0].intensity, pulses.channel_b[0].frequency)
 
         return pulses
     
-    def _calculate_enhanced_frequency(self, position: float, time: float,
-                                   channel: str, velocity: float = 0.0) -> float:
-        """Calculate frequency with velocity modulation within user constraints.
+    def _calculate_enhanced_frequencies(self, position: float, time: float) -> Tuple[float, float]:
+        """Calculate channel A and B frequencies with velocity modulation within user constraints.
 
         Velocity now modulates frequency - faster movements = higher pulse rate.
         This provides the "speed" sensation without affecting amplitude.
-        """
 
-        # Get channel-specific bounds
-        if channel == 'A':
-            min_freq = self.motion_params.channel_a.minimum_frequency.interpolate(0.0)
-            max_freq = self.motion_params.channel_a.maximum_frequency.interpolate(0.0)
-        else:  # channel == 'B'
-            min_freq = self.motion_params.channel_b.minimum_frequency.interpolate(0.0)
-            max_freq = self.motion_params.channel_b.maximum_frequency.interpolate(0.0)
+        Both channels share the algorithm selection, velocity factor and normalized
+        speed; only the frequency bounds differ, so everything else is resolved once.
+        """
 
-        # Get frequency algorithm selection directly from settings for instant updates
+        # Get frequency algorithm selection directly from settings for instant updates,
+        # parsing the (display name) string only when the selection changes
         freq_algorithm = settings.COYOTE_MOTION_FREQUENCY_ALGORITHM.get()
-
-        # Calculate base frequency based on algorithm
-        # Handle display names like "Position Based", "Blend (Position + Noise)", etc.
-        algo_str = str(freq_algorithm).upper() if freq_algorithm else "FIXED"
-
-        if "BLEND" in algo_str:
-            base_freq = self._blend_frequency(position, time, min_freq, max_freq)
-        elif "POSITION" in algo_str:
-            base_freq = self._position_frequency(position, min_freq, max_freq)
-        elif "VARIED" in algo_str or "NOISE" in algo_str:
-            base_freq = self._varied_frequency(position, time, min_freq, max_freq)
-        else:  # FIXED or unknown
-            base_freq = (min_freq + max_freq) / 2.0
+        if freq_algorithm != self._freq_algorithm_setting:
+            self._freq_algorithm_setting = freq_algorithm
+            self._freq_algorithm = FrequencyAlgorithm.from_setting(freq_algorithm)
+        algorithm = self._freq_algorithm
 
         # Apply velocity modulation to frequency
         # Uses average velocity over a timeframe window, normalized against global funscript max
@@ -733,63 +832,94 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
 
         # Normalize against global funscript velocity range
         # calibrated_max_speed is the 95th percentile of all velocities in the funscript
-        max_speed = getattr(self, 'calibrated_max_speed', 5.0)
-        normalized_speed = clamp(avg_velocity / max_speed, 0.0, 1.0)
-
-        # Calculate velocity-based frequency (maps full range: slow=min_freq, fast=max_freq)
-        velocity_based_freq = min_freq + normalized_speed * (max_freq - min_freq)
+        normalized_speed = clamp(avg_velocity / self.calibrated_max_speed, 0.0, 1.0)
+
+        # Settings.get() is already memoized, but the base-frequency helpers would read
+        # them again for each channel; resolve the ones this algorithm needs once per tick
+        varied_range = blend_ratio = None
+        if algorithm is FrequencyAlgorithm.VARIED or algorithm is FrequencyAlgorithm.BLEND:
+            varied_range = settings.COYOTE_MOTION_VARIED_RANGE.get()
+        if algorithm is FrequencyAlgorithm.BLEND:
+            blend_ratio = settings.COYOTE_MOTION_BLEND_RATIO.get()
+
+        frequencies = []
+        for min_freq, max_freq in (self._freq_bounds_a, self._freq_bounds_b):
+
+            # Calculate base frequency based on algorithm
+            if algorithm is FrequencyAlgorithm.BLEND:
+                base_freq = self._blend_frequency(position, time, min_freq, max_freq,
+                                                  blend_ratio, varied_range)
+            elif algorithm is FrequencyAlgorithm.POSITION:
+                base_freq = self._position_frequency(position, min_freq, max_freq)
+            elif algorithm is FrequencyAlgorithm.VARIED:
+                base_freq = self._varied_frequency(position, time, min_freq, max_freq, varied_range)
+            else:  # FIXED or unknown
+                base_freq = (min_freq + max_freq) / 2.0
+
+            # Calculate velocity-based frequency (maps full range: slow=min_freq, fast=max_freq)
+            velocity_based_freq = min_freq + normalized_speed * (max_freq - min_freq)
+
+            # Blend between base_freq and velocity_based_freq based on velocity_factor_setting
+            # 0% = pure base_freq, 100% = pure velocity control
+            modulated_freq = base_freq * (1.0 - velocity_factor_setting) + velocity_based_freq * velocity_factor_setting
+
+            # Log frequency calculation (occasionally, channel A only)
+            if (not frequencies and logger.isEnabledFor(logging.INFO)
+                    and self._last_freq_log + 2.0 < self._last_debug_log):
+                self._last_freq_log = self._last_debug_log
+                logger.info("  FREQ: algorithm='%s', base=%.1f, vel_based=%.1f, avg_vel=%.3f, norm_speed=%.2f, "
+                            "blend=%.0f%%, result=%.1f",
+                            freq_algorithm, base_freq, velocity_based_freq, avg_velocity, normalized_speed,
+                            velocity_factor_setting * 100, modulated_freq)
+
+            frequencies.append(clamp(modulated_freq, min_freq, max_freq))
+
+        return frequencies[0], frequencies[1]
 
-        # Blend between base_freq and velocity_based_freq based on velocity_factor_setting
-        # 0% = pure base_freq, 100% = pure velocity control
-        modulated_freq = base_freq * (1.0 - velocity_factor_setting) + velocity_based_freq * velocity_factor_setting
-
-        # Log frequency calculation (occasionally)
-        if channel == 'A' and (not hasattr(self, '_last_freq_log') or
-            getattr(self, '_last_freq_log', 0) + 2.0 < getattr(self, '_last_debug_log', 0)):
-            self._last_freq_log = getattr(self, '_last_debug_log', 0)
-            logger.info(f"  FREQ: algorithm='{freq_algorithm}', base={base_freq:.1f}, vel_based={velocity_based_freq:.1f}, "
-                       f"avg_vel={avg_velocity:.3f}, norm_speed={normalized_speed:.2f}, "
-                       f"blend={velocity_factor_setting:.0%}, result={modulated_freq:.1f}")
-
-        return clamp(modulated_freq, min_freq, max_freq)
-    
     def _position_frequency(self, position: float, min_freq: float, max_freq: float) -> float:
         """Standard position-based frequency mapping"""
         return min_freq + position * (max_freq - min_freq)
 
     def _varied_frequency(self, position: float, time: float,
-                        min_freq: float, max_freq: float) -> float:
+                        min_freq: float, max_freq: float,
+                        varied_range: Optional[float] = None) -> float:
         """Noise-based frequency variation around center frequency"""
         # Get the range setting (0.0 to 1.0)
-        varied_range = settings.COYOTE_MOTION_VARIED_RANGE.get()
+        if varied_range is None:
+            varied_range = settings.COYOTE_MOTION_VARIED_RANGE.get()
 
         # Use center frequency as base
         center_freq = (min_freq + max_freq) / 2.0
         freq_range = (max_freq - min_freq) / 2.0
 
-        # Generate noise oscillation (-1 to +1)
-        noise_value = math.sin(time * 0.7) * 0.67 + math.sin(time * 1.3) * 0.33
+        # Generate noise oscillation (-1 to +1), reusing the value when both
+        # channels ask for the same time
+        noise_time, noise_value = self._noise_sample
+        if noise_time != time:
+            noise_value = math.sin(time * 0.7) * 0.67 + math.sin(time * 1.3) * 0.33
+            self._noise_sample = (time, noise_value)
 
         # Apply range setting: noise_value * range * freq_range
         return center_freq + noise_value * varied_range * freq_range
 
     def _blend_frequency(self, position: float, time: float,
-                      min_freq: float, max_freq: float) -> float:
+                      min_freq: float, max_freq: float,
+                      blend_ratio: Optional[float] = None,
+                      varied_range: Optional[float] = None) -> float:
         """Blend of position and varied algorithms"""
         # Get the blend ratio setting (0.0 = position, 1.0 = noise)
-        blend_ratio = settings.COYOTE_MOTION_BLEND_RATIO.get()
+        if blend_ratio is None:
+            blend_ratio = settings.COYOTE_MOTION_BLEND_RATIO.get()
 
         position_freq = self._position_frequency(position, min_freq, max_freq)
-        varied_freq = self._varied_frequency(position, time, min_freq, max_freq)
+        varied_freq = self._varied_frequency(position, time, min_freq, max_freq, varied_range)
 
         return position_freq * (1.0 - blend_ratio) + varied_freq * blend_ratio
     
     def has_funscript_data(self) -> bool:
         """Check if valid funscript motion data is loaded"""
-        if not hasattr(self, 'position_data') or not hasattr(self, 'velocity_data'):
-            return False
         # Check if we have more than just the default single point
-        return len(self.position_data) > 1 and len(self.velocity_data) > 1
+        return len(self._times_np) > 1
 
     def get_pulses_at_time(self, time: float) -> CoyotePulses:
         """Generate pulses using Motion Algorithm conversion"""
@@ -802,14 +932,14 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
 
         # Calculate real-time velocity from actual position change
         # This is more accurate than interpolated pre-computed velocity for movement detection
-        if self._prev_position is not None and self._prev_position_time is not None:
-            time_delta = time - self._prev_position_time
-            if time_delta > 0.001:  # Avoid division by near-zero
-                self._realtime_velocity = (pos - self._prev_position) / time_delta
-            # If time_delta is too small, keep previous realtime_velocity
-        else:
+        # (_prev_position and _prev_position_time are always set together)
+        prev_time = self._prev_position_time
+        if prev_time is None:
             # First call - use pre-computed velocity as initial estimate
             self._realtime_velocity = vel
+        elif time - prev_time > 0.001:  # Avoid division by near-zero
+            self._realtime_velocity = (pos - self._prev_position) / (time - prev_time)
+        # If time_delta is too small, keep previous realtime_velocity
 
         # Update tracking for next call
         self._prev_position = pos
@@ -821,15 +951,25 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
 
         # Calculate dynamic volume based on velocity and stroke rate
         # This detects section intensity and affects both output AND UI (green bar)
-        dynamic_enabled = settings.COYOTE_MOTION_DYNAMIC_VOLUME_ENABLED.get()
-        if dynamic_enabled:
-            self.current_dynamic_volume = self._calculate_dynamic_volume(vel, time)
+        # The result is smoothed over a multi-second window, so it is refreshed at most
+        # every 50ms. `time` is system time, so the lower bound only guards against a
+        # clock going backwards; a media seek is picked up on the next 50ms refresh
+        if settings.COYOTE_MOTION_DYNAMIC_VOLUME_ENABLED.get():
+            if not (self._dyn_vol_last_recalc <= time < self._dyn_vol_last_recalc + 0.05):
+                self.current_dynamic_volume = self._calculate_dynamic_volume(vel, time)
+                self._dyn_vol_last_recalc = time
         else:
             self.current_dynamic_volume = 1.0
+            self._dyn_vol_last_recalc = float('-inf')
 
         # Update external volume axis for UI display (green bar)
-        if hasattr(self.motion_params.volume.external, 'add'):
-            self.motion_params.volume.external.add(self.current_dynamic_volume)
+        # Only push when the value moved noticeably or the last push is older than 50ms
+        if self._external_volume is not None and (
+                abs(self.current_dynamic_volume - self._last_pushed_dyn_vol) > 0.01
+                or not (self._last_push_time <= time < self._last_push_time + 0.05)):
+            self._external_volume.add(self.current_dynamic_volume)
+            self._last_pushed_dyn_vol = self.current_dynamic_volume
+            self._last_push_time = time
 
         # Apply positional channel distribution
         channel_a_amp, channel_b_amp = self._apply_positional_effect(motion_amplitude, normalized_pos)
@@ -839,24 +979,29 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
             channel_a_amp, channel_b_amp, normalized_pos, time
         )
 
-        # Get enhanced frequencies with velocity modulation
-        freq_a = self._calculate_enhanced_frequency(normalized_pos, time, 'A', vel)
-        freq_b = self._calculate_enhanced_frequency(normalized_pos, time, 'B', vel)
+        # Get enhanced frequencies with velocity modulation for both channels in one pass
+        freq_a, freq_b = self._calculate_enhanced_frequencies(normalized_pos, time)
 
         # Apply volume scaling (existing volume system + dynamic volume)
         volume_at_time = self._calculate_total_volume(time)
 
-        channel_a_intensity = int(channel_a_amp * volume_at_time * 100)
-        channel_b_intensity = int(channel_b_amp * volume_at_time * 100)
+        intensity_scale = volume_at_time * 100
+        channel_a_intensity = int(channel_a_amp * intensity_scale)
+        channel_b_intensity = int(channel_b_amp * intensity_scale)
 
         # Detailed logging to trace the calculation pipeline (occasional)
-        if not hasattr(self, '_last_calc_log') or time - self._last_calc_log > 1.0:
+        if logger.isEnabledFor(logging.INFO) and time - self._last_calc_log > 1.0:
             self._last_calc_log = time
-            logger.info(f"CALC TRACE: pos={pos:.3f}, precomputed_vel={vel:.3f}, realtime_vel={self._realtime_velocity:.3f}, acc={acc:.3f}")
-            logger.info(f"  -> motion_amplitude={motion_amplitude:.4f}, normalized_pos={normalized_pos:.3f}")
-            logger.info(f"  -> channel_amps: A={channel_a_amp:.4f}, B={channel_b_amp:.4f}")
-            logger.info(f"  -> volume_at_time={volume_at_time:.4f}")
-            logger.info(f"  -> FINAL intensities: A={channel_a_intensity}%, B={channel_b_intensity}%")
+            logger.info("CALC TRACE: pos=%.3f, precomputed_vel=%.3f, realtime_vel=%.3f, acc=%.3f\n"
+                        "  -> motion_amplitude=%.4f, normalized_pos=%.3f\n"
+                        "  -> channel_amps: A=%.4f, B=%.4f\n"
+                        "  -> volume_at_time=%.4f\n"
+                        "  -> FINAL intensities: A=%d%%, B=%d%%",
+                        pos, vel, self._realtime_velocity, acc,
+                        motion_amplitude, normalized_pos,
+                        channel_a_amp, channel_b_amp,
+                        volume_at_time,
+                        channel_a_intensity, channel_b_intensity)
 
         # Generate pulses using existing Coyote infrastructure
         return self._generate_motion_pulses(freq_a, freq_b,
@@ -872,19 +1017,26 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         standard_volume = self._get_standard_volume_at_time(time)
 
         # Get dynamic volume (already calculated in get_pulses_at_time)
-        dynamic_volume = getattr(self, 'current_dynamic_volume', 1.0)
+        dynamic_volume = self.current_dynamic_volume
 
         total = standard_volume * dynamic_volume
 
         # Log the combined volume (occasionally)
-        if not hasattr(self, '_last_total_vol_log') or time - getattr(self, '_last_total_vol_log', 0) > 2.0:
+        if logger.isEnabledFor(logging.INFO) and time - self._last_total_vol_log > 2.0:
             self._last_total_vol_log = time
-            logger.info(f"  TOTAL VOL: standard={standard_volume:.3f} * dynamic={dynamic_volume:.3f} = {total:.3f}")
+            logger.info("  TOTAL VOL: standard=%.3f * dynamic=%.3f = %.3f", standard_volume, dynamic_volume, total)
 
         return total
     
     def _get_standard_volume_at_time(self, time: float) -> float:
-        """Get standard volume from existing volume system"""
+        """Get standard volume from existing volume system.
+
+        Volume changes far slower than the packet rate, so a value sampled within
+        the last 10ms (in either direction, to survive seeks) is reused.
+        """
+        if abs(time - self._standard_volume_time) < 0.01:
+            return self._standard_volume
+
         # For Motion Algorithm:
         # - api_volume: from tcode/funscript volume commands
         # - master_volume: the spinbox setting (user's max volume)
@@ -895,11 +1047,13 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
 
         # Only use api and master - external is used for UI display, not internal calculation
         total = api_volume * master_volume
+        self._standard_volume_time = time
+        self._standard_volume = total
 
         # Log volume components (occasionally)
-        if not hasattr(self, '_last_vol_log_time') or getattr(self, '_last_vol_log_time', 0) + 1.0 < getattr(self, '_last_debug_log', 0):
-            self._last_vol_log_time = getattr(self, '_last_debug_log', 0)
-            logger.info(f"  VOLUME: api={api_volume:.3f}, master={master_volume:.3f} -> total={total:.3f}")
+        if logger.isEnabledFor(logging.INFO) and self._last_vol_log_time + 1.0 < self._last_debug_log:
+            self._last_vol_log_time = self._last_debug_log
+            logger.info("  VOLUME: api=%.3f, master=%.3f -> total=%.3f", api_volume, master_volume, total)
 
         return total
     
@@ -911,30 +1065,30 @@ class CoyoteMotionAlgorithm(CoyoteAlgorithm):
         freq_a = clamp(freq_a, HARDWARE_MIN_FREQ_HZ, HARDWARE_MAX_FREQ_HZ)
         freq_b = clamp(freq_b, HARDWARE_MIN_FREQ_HZ, HARDWARE_MAX_FREQ_HZ)
 
-        # Calculate durations from frequency and clamp to hardware limits
-        duration_a = int(clamp(1000.0 / freq_a, MIN_PULSE_DURATION_MS, MAX_PULSE_DURATION_MS))
-        duration_b = int(clamp(1000.0 / freq_b, MIN_PULSE_DURATION_MS, MAX_PULSE_DURATION_MS))
+        # Calculate durations from frequency. The hardware frequency limits are the
+        # reciprocals of the pulse duration limits, so no second clamp is needed
+        duration_a = int(1000.0 / freq_a)
+        duration_b = int(1000.0 / freq_b)
 
         # Clamp intensities to valid range
         intensity_a = int(clamp(intensity_a, 0, 100))
         intensity_b = int(clamp(intensity_b, 0, 100))
 
-        channel_a_pulses = []
-        channel_b_pulses = []
-
-        for i in range(4):  # Generate 4 pulses per packet (Coyote standard)
-            pulse_a = CoyotePulse(
-                frequency=int(freq_a),
-                intensity=intensity_a,
-                duration=duration_a
-            )
-            pulse_b = CoyotePulse(
-                frequency=int(freq_b),
-                intensity=intensity_b,
-                duration=duration_b
-            )
-
-            channel_a_pulses.append(pulse_a)
-            channel_b_pulses.append(pulse_b)
-
-        return CoyotePulses(channel_a=channel_a_pulses, channel_b=channel_b_pulses)
\ No newline at end of file
+        # Every pulse in the packet is identical, so the packet duration is known up front
+        self._packet_durations_ms = (duration_a * PULSES_PER_PACKET, duration_b * PULSES_PER_PACKET)
+
+        pulse_a = CoyotePulse(
+            frequency=int(freq_a),
+            intensity=intensity_a,
+            duration=duration_a
+        )
+        pulse_b = CoyotePulse(
+            frequency=int(freq_b),
+            intensity=intensity_b,
+            duration=duration_b
+        )
+
+        # Generate 4 pulses per packet (Coyote standard). Pulses are treated as
+        # read-only downstream (the UI stores its own copies), so one instance is shared.
+        return CoyotePulses(channel_a=[pulse_a] * PULSES_PER_PACKET,
+                            channel_b=[pulse_b] * PULSES_PER_PACKET)
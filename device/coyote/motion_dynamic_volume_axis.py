@@ -9,47 +9,61 @@ class MotionDynamicVolumeAxis(AbstractAxis):
     def __init__(self, funscript_axis: AbstractAxis, window_size: float = 2.0):
         self.funscript_axis = funscript_axis
         self.window_size = window_size
-        self.position_history = []
         self.last_update = time.time()
+
+        # Sample offsets (seconds before the current time) for the activity window, 10Hz sampling
+        sample_interval = 0.1
+        self._sample_offsets = np.arange(int(self.window_size / sample_interval)) * sample_interval
+
+        # Scratch buffers reused by every activity calculation
+        self._sample_times = np.empty_like(self._sample_offsets)
+        self._sample_deltas = np.empty(max(len(self._sample_offsets) - 1, 0))
+
+        # The activity window only changes meaningfully over ~100ms, so results are
+        # reused for timestamps within the same cache quantum
+        self._cache_quantum = 0.05
+        self._last_cache_key = None
+        self._last_result = 1.0
         
     def interpolate(self, timestamp):
         """Calculate dynamic volume multiplier based on recent activity"""
-        # Get current position from funscript
-        current_pos = self.funscript_axis.interpolate(timestamp)
-        
+        cache_key = timestamp // self._cache_quantum
+        if cache_key == self._last_cache_key:
+            return self._last_result
+
         # Calculate recent activity level
         recent_velocity = self._calculate_recent_activity_level(timestamp)
         
         # Map activity to dynamic volume multiplier (0.5 - 1.5)
         # High activity = higher volume, Low activity = lower volume
         dynamic_multiplier = 0.5 + recent_velocity * 1.0
-        
+
+        self._last_cache_key = cache_key
+        self._last_result = dynamic_multiplier
         return dynamic_multiplier
         
     def _calculate_recent_activity_level(self, current_time):
         """Calculate average velocity over time window"""
-        # Sample funscript positions over last N seconds
-        samples = []
-        sample_interval = 0.1  # 10Hz sampling
-        
-        for i in range(int(self.window_size / sample_interval)):
-            sample_time = current_time - i * sample_interval
-            sample_pos = self.funscript_axis.interpolate(sample_time)
-            samples.append(sample_pos)
-            
-        if len(samples) < 2:
+        if len(self._sample_offsets) < 2:
             return 0.5
-            
+
+        # Sample funscript positions over last N seconds in one batch interpolation
+        sample_times = np.subtract(current_time, self._sample_offsets, out=self._sample_times)
+        samples = np.asarray(self.funscript_axis.interpolate(sample_times), dtype=np.float64)
+        if samples.shape != sample_times.shape:
+            # Axis without batch support (e.g. a constant axis returns a scalar)
+            samples = np.array([self.funscript_axis.interpolate(t) for t in sample_times], dtype=np.float64)
+
         # Calculate average absolute velocity
-        velocities = [abs(samples[i] - samples[i-1]) for i in range(1, len(samples))]
-        avg_velocity = sum(velocities) / len(velocities)
+        deltas = np.subtract(samples[1:], samples[:-1], out=self._sample_deltas)
+        avg_velocity = float(np.abs(deltas, out=deltas).mean())
         
         # Map to 0-1 range (typical max velocity = 50 pos/s)
         return min(avg_velocity / 50.0, 1.0)
         
     def last_value(self):
         """Return last calculated value"""
-        return 1.0  # Default multiplier
+        return self._last_result  # Default multiplier (1.0) until first interpolate()
         
     def add(self, value, interval=0.0):
         """No-op - this axis is calculated dynamically"""
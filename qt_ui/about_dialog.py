@@ -7,21 +7,7 @@ from version import VERSION
 
 logger = logging.getLogger('restim.bake_audio')
 
-class AboutDialog(QDialog, Ui_AboutDialog):
-    def __init__(self, parent):
-        super().__init__(parent)
-
-        self.setupUi(self)
-        self._update_label()
-
-        # Connect to theme changes
-        ThemeManager.instance().theme_changed.connect(self._on_theme_changed)
-
-    def _update_label(self):
-        # Use a readable link color based on theme
-        link_color = "#64a0ff" if ThemeManager.instance().is_dark_mode() else "#334327"
-        self.label.setText(
-            f"""
+_ABOUT_HTML_TEMPLATE = """
 <html>
 	<head/>
 	<body>
@@ -30,7 +16,7 @@ class AboutDialog(QDialog, Ui_AboutDialog):
 			</span>
 		</p>
 		<p>
-			version: {VERSION}
+			version: {version}
 		</p>
 		<p>
 			homepage: <a href="https://github.com/diglet48/restim">
@@ -40,8 +26,26 @@ class AboutDialog(QDialog, Ui_AboutDialog):
 		</p>
 	</body>
 </html>
-            """
-        )
+"""
+
+
+class AboutDialog(QDialog, Ui_AboutDialog):
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        self.setupUi(self)
+        self._cached_is_dark = None
+        self._update_label(ThemeManager.instance().is_dark_mode())
+
+        # Connect to theme changes
+        ThemeManager.instance().theme_changed.connect(self._on_theme_changed)
+
+    def _update_label(self, is_dark: bool):
+        self._cached_is_dark = is_dark
+        # Use a readable link color based on theme
+        link_color = "#64a0ff" if is_dark else "#334327"
+        self.label.setText(_ABOUT_HTML_TEMPLATE.format(link_color=link_color, version=VERSION))
 
     def _on_theme_changed(self, is_dark: bool):
-        self._update_label()
\ No newline at end of file
+        if is_dark != self._cached_is_dark:
+            self._update_label(is_dark)
@@ -1,13 +1,14 @@
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Dict, Optional
+import numpy as np
 from PySide6 import QtWidgets
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QSlider, QHBoxLayout,
-                            QGraphicsView, QGraphicsScene, QSpinBox,
-                            QGraphicsRectItem)
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPen, QColor, QBrush, QFontMetrics
+                            QSpinBox)
+from PySide6.QtCore import Qt, QTimer, QRectF, Slot
+from PySide6.QtGui import QPen, QColor, QBrush, QFontMetrics, QPainter, QImage
 from device.coyote.device import CoyoteDevice, CoyotePulse, CoyotePulses, CoyoteStrengths
 from qt_ui import settings
 from qt_ui.theme_manager import ThemeManager
@@ -69,9 +70,7 @@ class CoyoteSettingsWidget(QtWidgets.QWidget):
         self.device.pulse_sent.connect(self.on_pulse_sent)
 
         # Clear "No Funscript" flag when setting up device (prevents stale state from previous mode)
-        for control in self.channel_controls.values():
-            if control.pulse_graph and hasattr(control.pulse_graph.plot, 'set_no_funscript_message'):
-                control.pulse_graph.plot.set_no_funscript_message(False)
+        self._set_no_funscript_message(False)
 
         for control in self.channel_controls.values():
             control.reset_volume()
@@ -91,13 +90,16 @@ class CoyoteSettingsWidget(QtWidgets.QWidget):
     # Note: on_connection_status_changed, on_battery_level_changed, and on_reset_connection_clicked
     # are now handled by CoyoteStatusWidget in the main window
 
+    @Slot()
     def on_parameters_changed(self):
         pass
 
+    @Slot(CoyoteStrengths)
     def on_power_levels_changed(self, strengths: CoyoteStrengths):
         for control in self.channel_controls.values():
             control.update_from_device(strengths)
 
+    @Slot(CoyotePulses)
     def on_pulse_sent(self, pulses: CoyotePulses):
         if not self.device:
             return
@@ -117,12 +119,13 @@ class CoyoteSettingsWidget(QtWidgets.QWidget):
             show_no_funscript = all_zero
 
         # Always update the flag (clears it for non-Motion modes)
-        for control in self.channel_controls.values():
-            if control.pulse_graph and hasattr(control.pulse_graph.plot, 'set_no_funscript_message'):
-                control.pulse_graph.plot.set_no_funscript_message(show_no_funscript)
+        self._set_no_funscript_message(show_no_funscript)
 
+        # One timestamp for the whole packet, shared by both channels
+        strengths = self.device.strengths
+        timestamp = time.time()
         for control in self.channel_controls.values():
-            control.apply_pulses(pulses, self.device.strengths)
+            control.apply_pulses(pulses, strengths, timestamp)
 
     def apply_debug_logging(self, enabled: bool):
         new_level = logging.DEBUG if enabled else logging.INFO
@@ -139,9 +142,12 @@ class CoyoteSettingsWidget(QtWidgets.QWidget):
 
     def clear_no_funscript_message(self):
         """Clear the 'No Funscript' message from pulse graphs. Called when starting playback."""
+        self._set_no_funscript_message(False)
+
+    def _set_no_funscript_message(self, show: bool):
         for control in self.channel_controls.values():
-            if control.pulse_graph and hasattr(control.pulse_graph.plot, 'set_no_funscript_message'):
-                control.pulse_graph.plot.set_no_funscript_message(False)
+            if control.pulse_graph:
+                control.pulse_graph.plot.set_no_funscript_message(show)
 
 @dataclass(frozen=True)
 class ChannelConfig:
@@ -151,6 +157,8 @@ class ChannelConfig:
     strength_max_setting: settings.Setting
 
 class ChannelControl:
+    _volume_label_min_widths: Dict[str, int] = {}
+
     def __init__(self, parent: 'CoyoteSettingsWidget', config: ChannelConfig):
         self.parent = parent
         self.config = config
@@ -163,14 +171,13 @@ class ChannelControl:
         self.pulse_graph: Optional[PulseGraphContainer] = None
         self.stats_label: Optional[QLabel] = None
 
+        # Resolved once; consulted for every strength update and pulse packet
+        self._is_a = config.channel_id.upper() == 'A'
+
     @property
     def channel_id(self) -> str:
         return self.config.channel_id
 
-    @property
-    def _is_channel_a(self) -> bool:
-        return self.channel_id.upper() == 'A'
-
     def build_ui(self) -> QHBoxLayout:
         layout = QHBoxLayout()
 
@@ -234,8 +241,13 @@ class ChannelControl:
         self.volume_label.setAlignment(Qt.AlignHCenter)
         # Set minimum width to prevent layout shifts when text changes
         # "200 (100%)" is the maximum text, use font metrics to calculate width
-        fm = QFontMetrics(self.volume_label.font())
-        min_width = fm.horizontalAdvance("200 (100%)") + 4  # Add small padding
+        # (measured once per font, the controls are rebuilt on every device switch)
+        font = self.volume_label.font()
+        min_width = ChannelControl._volume_label_min_widths.get(font.key())
+        if min_width is None:
+            fm = QFontMetrics(font)
+            min_width = fm.horizontalAdvance("200 (100%)") + 4  # Add small padding
+            ChannelControl._volume_label_min_widths[font.key()] = min_width
         self.volume_label.setMinimumWidth(min_width)
         volume_layout.addWidget(self.volume_slider)
         volume_layout.addWidget(self.volume_label)
@@ -248,24 +260,24 @@ class ChannelControl:
         self.set_strength_from_device(0)
 
     def select_strength(self, strengths: CoyoteStrengths) -> int:
-        return strengths.channel_a if self._is_channel_a else strengths.channel_b
+        return strengths.channel_a if self._is_a else strengths.channel_b
 
     def with_strength(self, strengths: CoyoteStrengths, value: int) -> CoyoteStrengths:
-        if self._is_channel_a:
+        if self._is_a:
             return CoyoteStrengths(channel_a=value, channel_b=strengths.channel_b)
         return CoyoteStrengths(channel_a=strengths.channel_a, channel_b=value)
 
     def extract_pulses(self, pulses: CoyotePulses) -> list[CoyotePulse]:
-        return pulses.channel_a if self._is_channel_a else pulses.channel_b
+        return pulses.channel_a if self._is_a else pulses.channel_b
 
     def update_from_device(self, strengths: CoyoteStrengths):
         self.set_strength_from_device(self.select_strength(strengths))
 
-    def apply_pulses(self, pulses: CoyotePulses, strengths: CoyoteStrengths):
+    def apply_pulses(self, pulses: CoyotePulses, strengths: CoyoteStrengths, timestamp: float):
         channel_pulses = self.extract_pulses(pulses)
         if not channel_pulses:
             return
-        self.handle_pulses(channel_pulses, self.select_strength(strengths))
+        self.handle_pulses(channel_pulses, self.select_strength(strengths), timestamp)
 
     def on_volume_changed(self, value: int):
         self.update_volume_label(value)
@@ -295,7 +307,8 @@ class ChannelControl:
         self.config.strength_max_setting.set(value)
 
         current_value = self.volume_slider.value() if self.volume_slider else 0
-        if self.volume_slider:
+        # The slider (and its label) only need reconfiguring when the limit actually moved
+        if self.volume_slider and self.volume_slider.maximum() != value:
             self.volume_slider.blockSignals(True)
             self.volume_slider.setRange(0, value)
             clamped_value = min(current_value, value)
@@ -332,7 +345,7 @@ class ChannelControl:
             self.freq_max.blockSignals(False)
         self.config.freq_max_setting.set(corrected)
 
-    def handle_pulses(self, pulses: list[CoyotePulse], strength: int):
+    def handle_pulses(self, pulses: list[CoyotePulse], strength: int, timestamp: float):
         if not self.pulse_graph or not pulses:
             return
 
@@ -344,8 +357,17 @@ class ChannelControl:
                 duration=pulse.duration,
                 current_strength=strength,
                 channel_limit=channel_limit,
+                timestamp=timestamp,
             )
 
+@dataclass(slots=True)
+class _PulseEntry:
+    """A pulse as recorded for the stats label and graph"""
+    frequency: int
+    intensity: int
+    duration: int
+    timestamp: float
+
 class PulseGraphContainer(QWidget):
     def __init__(self, window_seconds: settings.Setting, freq_min: QSpinBox, freq_max: QSpinBox, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -353,8 +375,15 @@ class PulseGraphContainer(QWidget):
         self.freq_min = freq_min
         self.freq_max = freq_max
 
-        # Initialize entries list to store CoyotePulse objects
-        self.entries = []
+        # Recent pulse entries in arrival order, capped as a safety net
+        self.entries = deque(maxlen=2000)
+
+        # Running intensity aggregates over self.entries. Min/max are only recomputed
+        # when an evicted entry held one of them.
+        self._intensity_sum = 0
+        self._intensity_min = None
+        self._intensity_max = None
+        self._intensity_range_stale = False
 
         # Time window for stats display (in seconds)
         self.stats_window = window_seconds
@@ -369,33 +398,19 @@ class PulseGraphContainer(QWidget):
         # Optional stats label managed by parent component
         self.stats_label: Optional[QLabel] = None
 
+        # The label is refreshed at most every 100ms; pulses arriving in between
+        # only record their stats (see add_pulse)
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(100)
+        self._label_timer.timeout.connect(self.update_label_text)
+
     def attach_stats_label(self, label: QLabel):
         self.stats_label = label
         self.stats_label.setText("Intensity: 0%")
         
-    def get_frequency_range_text(self, entries) -> str:
-        """Get the frequency range text from the given entries."""
-        if not entries:
-            return "N/A"
-        frequencies = [entry.frequency for entry in entries]
-        avg_frequency = sum(frequencies) / len(frequencies)
-        min_freq = min(frequencies)
-        max_freq = max(frequencies)
-        
-        # If min, max, and average are all the same, just show the single value
-        if min_freq == max_freq == round(avg_frequency):
-            return f"{int(avg_frequency)} Hz"
-        # If min and max differ, show average with range
-        return f"{avg_frequency:.0f} Hz ({min_freq} – {max_freq})"
-
-    def format_intensity_text(self, intensities) -> str:
+    def _format_intensity_stats(self, avg_intensity, min_intensity, max_intensity) -> str:
         """Format intensity text with smart range display."""
-        if not intensities:
-            return "N/A"
-        avg_intensity = sum(intensities) / len(intensities)
-        min_intensity = min(intensities)
-        max_intensity = max(intensities)
-        
         # If min, max, and average are all the same, just show the single value
         if min_intensity == max_intensity == round(avg_intensity):
             return f"{int(avg_intensity)}%"
@@ -404,60 +419,146 @@ class PulseGraphContainer(QWidget):
     
     def clean_old_entries(self):
         """Remove entries outside the time window"""
-        current_time = time.time()
-        stats_window = self.stats_window.get()
-        self.entries = [e for e in self.entries if current_time - e.timestamp <= stats_window]
-
+        cutoff = time.time() - self.stats_window.get()
+        # Entries are appended in timestamp order, so old ones are at the front
+        while self.entries and self.entries[0].timestamp < cutoff:
+            self._evict_oldest_entry()
+
+    def _evict_oldest_entry(self):
+        intensity = self.entries.popleft().intensity
+        self._intensity_sum -= intensity
+        if intensity == self._intensity_min or intensity == self._intensity_max:
+            self._intensity_range_stale = True
+
+    def _append_entry(self, pulse: _PulseEntry):
+        # Evict explicitly when full so the aggregates see the dropped entry
+        if len(self.entries) == self.entries.maxlen:
+            self._evict_oldest_entry()
+        self.entries.append(pulse)
+        intensity = pulse.intensity
+        self._intensity_sum += intensity
+        if self._intensity_min is None or intensity < self._intensity_min:
+            self._intensity_min = intensity
+        if self._intensity_max is None or intensity > self._intensity_max:
+            self._intensity_max = intensity
+
+    @Slot()
     def update_label_text(self):
         # Clean up old entries
         self.clean_old_entries()
         
         # Get intensity range from recent entries
-        recent_entries = self.entries
-        intensities = [entry.intensity for entry in recent_entries]
-        intensity_text = self.format_intensity_text(intensities)
+        if not self.entries:
+            self._intensity_min = self._intensity_max = None
+            self._intensity_range_stale = False
+            intensity_text = "N/A"
+        else:
+            if self._intensity_range_stale:
+                intensities = [entry.intensity for entry in self.entries]
+                self._intensity_min = min(intensities)
+                self._intensity_max = max(intensities)
+                self._intensity_range_stale = False
+            intensity_text = self._format_intensity_stats(self._intensity_sum / len(self.entries),
+                                                          self._intensity_min, self._intensity_max)
 
         if self.stats_label:
             self.stats_label.setText(f"Intensity: {intensity_text}")
 
-    def add_pulse(self, frequency, intensity, duration, current_strength, channel_limit):
+    def add_pulse(self, frequency, intensity, duration, current_strength, channel_limit, timestamp: float):
         # Calculate effective intensity after applying current strength
         effective_intensity = intensity * (current_strength / 100)
         
         # For zero intensity pulses, still create them but with zero intensity
         # This shows empty space in the graph
         
-        # Create a CoyotePulse object
-        pulse = CoyotePulse(
-            frequency=frequency, 
+        # Record the pulse, with its timestamp for time-window filtering
+        pulse = _PulseEntry(
+            frequency=frequency,
             intensity=intensity,
-            duration=duration
+            duration=duration,
+            timestamp=timestamp
         )
         
-        # Add timestamp for time-window filtering
-        pulse.timestamp = time.time()
-        
         # Store pulse data
-        self.entries.append(pulse)
-        
-        self.update_label_text()
+        self._append_entry(pulse)
+
+        if not self._label_timer.isActive():
+            self._label_timer.start()
 
         # Update the plot - even zero intensity pulses are sent through for visualization
-        self.plot.add_pulse(pulse, effective_intensity, channel_limit)
+        self.plot.add_pulse(pulse, effective_intensity, channel_limit, timestamp)
 
     def cleanup(self):
         """Stop timers and clean up resources"""
+        self._label_timer.stop()
         if self.plot:
             self.plot.cleanup()
 
+def _pulse_geometry(timestamps: np.ndarray, frequencies: np.ndarray, applied: np.ndarray,
+                    now: float, time_window: float, width: int, height: int,
+                    channel_limit: float, freq_min: int, color_count: int):
+    """
+    Bar geometry for the pulses visible in the window ending at `now`.
+    Returns (x, y, width, height, color_index) arrays; color_index is the
+    per-Hz color table index, or -1 for zero-intensity pulses.
+    """
+    # Use either the channel limit or the current max intensity, whichever is larger
+    scale_max = max(float(applied.max()), channel_limit)
+
+    # Get the time span of the visible pulses
+    oldest_time = now - time_window
+    newest_time = now
+    time_span_sec = time_window
+
+    # Calculate total width available for all pulses
+    usable_width = width - 10  # Leave small margin on right side
+
+    # For continuity each pulse extends to the start of the next one (within its packet,
+    # or the next packet's first pulse); pulses arrive in timestamp order and packets
+    # are contiguous, so that is simply the next pulse. The last one runs until now.
+    end_times = np.empty_like(timestamps)
+    end_times[:-1] = timestamps[1:]
+    end_times[-1] = now
+
+    # Ensure we're within the visible time window, skip pulses entirely outside it
+    start_times = np.maximum(timestamps, oldest_time)
+    end_times = np.minimum(end_times, newest_time)
+    visible = (end_times > oldest_time) & (start_times < newest_time)
+    start_times = start_times[visible]
+    end_times = end_times[visible]
+    frequencies = frequencies[visible]
+    applied = applied[visible]
+
+    # Calculate positions and dimensions
+    x_start = 5 + (start_times - oldest_time) / time_span_sec * usable_width
+    x_end = 5 + (end_times - oldest_time) / time_span_sec * usable_width
+    rect_width = np.maximum(3, x_end - x_start)  # Minimum 3px, but allow full width to fill gaps
+
+    if scale_max > 0:
+        rect_height = height * (applied / scale_max)
+    else:
+        rect_height = np.zeros_like(applied)
+
+    # Zero-intensity pulses become a thin line at the bottom to show timing without intensity
+    empty = applied <= 0
+    rect_height = np.where(empty, 2, rect_height)
+    y = height - rect_height  # bottom-aligned
+
+    # Color index per integer Hz, -1 for the empty-pulse brush
+    color_index = np.clip(frequencies.astype(np.int64) - freq_min, 0, color_count - 1)
+    color_index[empty] = -1
+
+    return x_start, y, rect_width, rect_height, color_index
+
+
 class PulseGraph(QWidget):
+    """Flat, non-interactive bar chart of recent pulses, painted directly with QPainter"""
+
     def __init__(self, window_seconds: settings.Setting, freq_min_spinbox: QSpinBox, freq_max_spinbox: QSpinBox, parent=None):
         super().__init__(parent)
-        self.setLayout(QVBoxLayout())
 
-        self.view = QGraphicsView()
-        self.scene = QGraphicsScene()
-        self.view.setScene(self.scene)
+        # paintEvent fills the whole widget, so Qt needn't clear it first
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
 
         # Set background based on current theme
         self._update_background_brush()
@@ -465,25 +566,18 @@ class PulseGraph(QWidget):
         # Connect to theme changes
         ThemeManager.instance().theme_changed.connect(self._on_theme_changed)
 
-        # Completely disable scrolling and user interaction
-        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.view.setInteractive(False)  # Disable interaction for performance
-        self.view.setDragMode(QGraphicsView.NoDrag)
-        self.view.setTransformationAnchor(QGraphicsView.NoAnchor)
-        self.view.setResizeAnchor(QGraphicsView.NoAnchor)
-        self.view.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
-
-        # Prevent wheel events
-        self.view.wheelEvent = lambda event: None
-
-        self.layout().addWidget(self.view)
-
         # Configuration for time window (in seconds)
         self.time_window = window_seconds
 
-        # Store pulses for visualization
-        self.pulses = []
+        # Pulses for visualization, stored column-wise in arrival (= timestamp) order.
+        # The live pulses are [_pulse_start:_pulse_end]; the arrays are twice the
+        # capacity so appending only has to compact the window once in a while.
+        self._pulse_capacity = 2000
+        self._timestamps = np.zeros(2 * self._pulse_capacity, dtype=np.float64)
+        self._frequencies = np.zeros(2 * self._pulse_capacity, dtype=np.float32)
+        self._applied_intensities = np.zeros(2 * self._pulse_capacity, dtype=np.float32)
+        self._pulse_start = 0
+        self._pulse_end = 0
         self.channel_limit = 100  # Default channel limit
 
         # Packet tracking for FIFO visualization
@@ -494,12 +588,21 @@ class PulseGraph(QWidget):
         self._dirty = False
         self._last_refresh_time = 0
 
-        # Initialize the scene size
-        self.updateSceneRect()
+        self._show_no_funscript = False
+        self._empty_pulse_brush = QBrush(QColor(100, 100, 100, 50))  # Almost transparent
+
+        # Off-screen frame rendered by refresh() and blitted by paintEvent
+        self._frame: Optional[QImage] = None
+        # Set when a refresh was skipped because the graph was fully covered;
+        # paintEvent renders a fresh frame when it is exposed again
+        self._frame_stale = False
 
+        # Repaints are scheduled on demand (new pulses, resize, theme or message changes)
+        # and keep ticking at 20Hz only while there are pulses left to scroll out of view
         self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh)
-        self.timer.start(50)  # 20Hz refresh rate (was 60Hz) - sufficient for visualization
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(50)
+        self.timer.timeout.connect(self._do_repaint)
 
         # Colors for visualization
         self.pulse_color = QColor(0, 255, 0, 200)  # Semi-transparent lime
@@ -511,237 +614,267 @@ class PulseGraph(QWidget):
         # Frequency range spinboxes from channel settings
         self.freq_min_spinbox = freq_min_spinbox
         self.freq_max_spinbox = freq_max_spinbox
+
+        # Pulse colors and brushes per integer Hz, rebuilt lazily when the frequency range changes
+        self._argb_table = np.zeros(0, dtype=np.uint32)
+        self._brush_cache: list[Optional[QBrush]] = []
+        self._cached_freq_range = (None, None)
+        for spinbox in (freq_min_spinbox, freq_max_spinbox):
+            if spinbox:
+                spinbox.valueChanged.connect(self._invalidate_brush_cache)
     
     def resizeEvent(self, event):
-        """Handle resize events by updating the scene rectangle"""
+        """Handle resize events"""
         super().resizeEvent(event)
-        self.updateSceneRect()
         # Mark dirty to force refresh on next timer tick
+        self._mark_dirty()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Refreshes stop while hidden; catch up as soon as the graph is shown again
+        self._mark_dirty()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Hidden (e.g. another tab is selected): no point waking up to scroll pulses
+        if self.timer is not None:
+            self.timer.stop()
+
+    def _mark_dirty(self):
         self._dirty = True
+        self._schedule_repaint()
+
+    def _schedule_repaint(self):
+        if self.timer is None or self.timer.isActive() or not self.isVisible():
+            return
+        if self.visibleRegion().isEmpty():
+            # Fully covered: don't tick, catch up in paintEvent once exposed
+            self._frame_stale = True
+            return
+        self.timer.start()
+
+    @Slot()
+    def _do_repaint(self):
+        self.refresh()
+        # Keep scrolling until the last pulse has left the time window
+        if self.pulse_count:
+            self._schedule_repaint()
     
-    def updateSceneRect(self):
-        """Update the scene rectangle to match the view size"""
-        if self.view:
-            width = self.view.viewport().width()
-            height = self.view.viewport().height()
-            self.view.setSceneRect(0, 0, width, height)
-    
-    def get_color_for_frequency(self, frequency: float) -> QColor:
-        """
-        Calculate color based on frequency using the channel's min/max settings.
-        Green at min frequency, yellow at midpoint, red at max frequency.
-        """
+    def _rebuild_brush_cache(self):
+        """Build the ARGB color table, one entry per integer Hz across the channel's min/max range"""
         # Get current min/max from spinboxes
         freq_min = self.freq_min_spinbox.value() if self.freq_min_spinbox else 10
         freq_max = self.freq_max_spinbox.value() if self.freq_max_spinbox else 200
+        self._cached_freq_range = (freq_min, freq_max)
 
-        # Calculate normalized position (0 = min freq, 1 = max freq)
         if freq_max <= freq_min:
-            t = 0.5  # Avoid division by zero
+            t = np.array([0.5])  # Avoid division by zero
         else:
-            t = (frequency - freq_min) / (freq_max - freq_min)
-            t = max(0, min(1, t))  # Clamp to [0, 1]
+            t = np.arange(freq_max - freq_min + 1) / (freq_max - freq_min)
 
         # Green (0, 255, 0) → Yellow (255, 255, 0) → Red (255, 0, 0)
-        if t <= 0.5:
-            # Green to Yellow: R increases from 0 to 255
-            r = int(255 * (t * 2))
-            g = 255
-            b = 0
-        else:
-            # Yellow to Red: G decreases from 255 to 0
-            r = 255
-            g = int(255 * (1 - (t - 0.5) * 2))
-            b = 0
+        # Green to Yellow: R increases from 0 to 255; Yellow to Red: G decreases from 255 to 0
+        first_half = t <= 0.5
+        r = np.where(first_half, (255 * (t * 2)).astype(np.uint32), 255).astype(np.uint32)
+        g = np.where(first_half, 255, (255 * (1 - (t - 0.5) * 2)).astype(np.uint32)).astype(np.uint32)
 
-        # Return with semi-transparency
-        return QColor(r, g, b, 200)
-    
-    def clean_old_pulses(self):
+        # Semi-transparent, packed as 0xAARRGGBB (blue is always 0)
+        self._argb_table = (200 << 24) | (r << 16) | (g << 8)
+        self._brush_cache = [None] * len(self._argb_table)
+
+    def _invalidate_brush_cache(self, *args):
+        self._cached_freq_range = (None, None)
+        self._mark_dirty()
+
+    def get_brush_for_frequency(self, frequency: float) -> QBrush:
+        """
+        Brush colored by frequency using the channel's min/max settings.
+        Green at min frequency, yellow at midpoint, red at max frequency.
+        Frequencies outside the range use the color of the nearest end.
+        """
+        if self._cached_freq_range[0] is None:
+            self._rebuild_brush_cache()
+        index = int(frequency) - self._cached_freq_range[0]
+        index = max(0, min(len(self._brush_cache) - 1, index))
+        return self._brush_at(index)
+
+    def _brush_at(self, index: int) -> QBrush:
+        brush = self._brush_cache[index]
+        if brush is None:
+            brush = self._brush_cache[index] = QBrush(QColor.fromRgba(int(self._argb_table[index])))
+        return brush
+
+    def clean_old_pulses(self, now: Optional[float] = None):
         """Remove pulses outside the time window"""
-        current_time = time.time()
-        time_window = self.time_window.get()
-        old_count = len(self.pulses)
-        self.pulses = [p for p in self.pulses if current_time - p.timestamp <= time_window]
-        if len(self.pulses) != old_count:
+        if now is None:
+            now = time.time()
+        cutoff = now - self.time_window.get()
+        # Pulses are appended in timestamp order, so old ones are at the front
+        timestamps = self._timestamps[self._pulse_start:self._pulse_end]
+        expired = int(np.searchsorted(timestamps, cutoff))
+        if expired:
+            self._pulse_start += expired
             self._dirty = True
 
-    def add_pulse(self, pulse: CoyotePulse, applied_intensity: float, channel_limit: int):
+    @property
+    def pulse_count(self) -> int:
+        return self._pulse_end - self._pulse_start
+
+    def add_pulse(self, pulse: _PulseEntry, applied_intensity: float, channel_limit: int, timestamp: float):
         """Add a new pulse to the visualization"""
         # Don't skip zero intensity pulses, but display them differently
         self.channel_limit = channel_limit
 
-        # Show every pulse - no deduplication
-        current_time = time.time()
+        # Drop the oldest pulse when full (safety net, the time window normally expires them first)
+        if self.pulse_count == self._pulse_capacity:
+            self._pulse_start += 1
 
-        # Store the CoyotePulse with additional metadata
-        pulse_copy = CoyotePulse(
-            frequency=pulse.frequency,
-            intensity=pulse.intensity,
-            duration=pulse.duration
-        )
-
-        # Add additional attributes to the pulse
-        pulse_copy.applied_intensity = applied_intensity
-        pulse_copy.packet_index = self.current_packet_index
-        pulse_copy.timestamp = current_time
+        # Out of room at the end of the arrays: move the live window back to the front
+        if self._pulse_end == len(self._timestamps):
+            count = self.pulse_count
+            for column in (self._timestamps, self._frequencies, self._applied_intensities):
+                column[:count] = column[self._pulse_start:self._pulse_end]
+            self._pulse_start, self._pulse_end = 0, count
 
         # Add the pulse
-        self.pulses.append(pulse_copy)
-        self._dirty = True
+        i = self._pulse_end
+        self._timestamps[i] = timestamp
+        self._frequencies[i] = pulse.frequency
+        self._applied_intensities[i] = applied_intensity
+        self._pulse_end += 1
+        self._mark_dirty()
 
-        # Clean up old pulses that are outside our time window (periodically)
-        if len(self.pulses) > 200:  # Only clean when list gets large
-            self.clean_old_pulses()
+        # Clean up old pulses that are outside our time window
+        self.clean_old_pulses(timestamp)
 
     def set_no_funscript_message(self, show: bool):
         """Set whether to show 'No Funscript' message"""
+        # Called for every pulse packet; only a change needs a redraw
+        if show == self._show_no_funscript:
+            return
         self._show_no_funscript = show
-        self._dirty = True
+        self._mark_dirty()
 
     def refresh(self):
-        """Redraw the pulse visualization"""
-        # Skip refresh if widget is not visible
+        """Schedule a repaint of the pulse visualization"""
+        # Skip refresh if widget is not visible or fully covered; the dirty flag
+        # is kept so the next refresh after it is exposed again catches up
         if not self.isVisible():
             return
+        if self.visibleRegion().isEmpty():
+            self._frame_stale = True
+            return
 
         # Skip refresh if nothing changed and we refreshed recently
         now = time.time()
         if not self._dirty and (now - self._last_refresh_time) < 0.1:
             return
 
+        self._update_frame(now)
+        self.update()
+
+    def _update_frame(self, now: float):
         self._dirty = False
+        self._frame_stale = False
         self._last_refresh_time = now
 
         # Clean up old pulses periodically
-        self.clean_old_pulses()
-
-        self.scene.clear()
-
-        # Always ensure we're using the current viewport size
-        self.updateSceneRect()
-
-        width = self.view.viewport().width()
-        height = self.view.viewport().height()
+        self.clean_old_pulses(now)
+
+        self._render_frame(now)
+
+    def paintEvent(self, event):
+        # Expose/overlap repaints between refreshes just blit the last rendered frame,
+        # unless refreshes were skipped while the graph was covered
+        dpr = self.devicePixelRatioF()
+        if self._frame_stale or self._frame is None or self._frame.size() != self.size() * dpr:
+            self._update_frame(time.time())
+            # Resume scrolling if it stopped while covered
+            if self.pulse_count:
+                self._schedule_repaint()
+        painter = QPainter(self)
+        # The target rect is in logical pixels, the source rect in frame (device) pixels
+        target = QRectF(event.rect())
+        source = QRectF(target.x() * dpr, target.y() * dpr, target.width() * dpr, target.height() * dpr)
+        painter.drawImage(target, self._frame, source)
+        painter.end()
+
+    def _render_frame(self, now: float):
+        """Render the graph at time `now` into the off-screen frame image"""
+        dpr = self.devicePixelRatioF()
+        if self._frame is None or self._frame.size() != self.size() * dpr:
+            self._frame = QImage(self.size() * dpr, QImage.Format_ARGB32_Premultiplied)
+            self._frame.setDevicePixelRatio(dpr)
+
+        width = self.width()
+        height = self.height()
+
+        painter = QPainter(self._frame)
+        painter.fillRect(self.rect(), self._background_color)
 
         # Show "No Funscript" message if flag is set or no pulses
-        if not self.pulses:
-            if getattr(self, '_show_no_funscript', False):
-                text_item = self.scene.addText("No Funscript")
-                text_item.setDefaultTextColor(QColor(150, 150, 150))
-                # Center the text
-                text_rect = text_item.boundingRect()
-                text_item.setPos((width - text_rect.width()) / 2, (height - text_rect.height()) / 2)
+        if not self.pulse_count:
+            if self._show_no_funscript:
+                painter.setPen(QColor(150, 150, 150))
+                painter.drawText(self.rect(), Qt.AlignCenter, "No Funscript")
+            painter.end()
             return
 
-        # Sort pulses by timestamp so they display in chronological order
-        sorted_pulses = sorted(self.pulses, key=lambda p: p.timestamp)
-
-        # Find the maximum intensity in current visible pulses
-        max_intensity = max(pulse.applied_intensity for pulse in sorted_pulses)
-        # Use either the channel limit or the current max intensity, whichever is larger
-        scale_max = max(max_intensity, self.channel_limit)
-
-        # Get the time span of the visible pulses
-        time_window = self.time_window.get()
-        oldest_time = now - time_window
-        newest_time = now
-        time_span_sec = time_window
-
-        # Calculate total width available for all pulses
-        usable_width = width - 10  # Leave small margin on right side
-
-        # Group pulses by packet for continuous display
-        pulses_by_packet = {}
-        for pulse in sorted_pulses:
-            packet_idx = pulse.packet_index
-            if packet_idx not in pulses_by_packet:
-                pulses_by_packet[packet_idx] = []
-            pulses_by_packet[packet_idx].append(pulse)
-
-        # Get sorted list of packet indices
-        packet_indices = sorted(pulses_by_packet.keys())
-
-        # Draw each packet's pulses as a continuous sequence
-        for i, packet_idx in enumerate(packet_indices):
-            packet_pulses = pulses_by_packet[packet_idx]  # Already sorted by timestamp from earlier
-
-            # Determine the time range this packet covers
-            if i < len(packet_indices) - 1:
-                # This packet runs until the next packet starts
-                next_packet_idx = packet_indices[i + 1]
-                next_packet_start = pulses_by_packet[next_packet_idx][0].timestamp
-                packet_end_time = next_packet_start
-            else:
-                # This is the last packet, it runs until now
-                packet_end_time = now
-
-            # Draw each pulse in this packet
-            for j, pulse in enumerate(packet_pulses):
-                # Calculate time positions
-                pulse_start_time = pulse.timestamp
-
-                # For continuity, calculate the end time:
-                if j < len(packet_pulses) - 1:
-                    # If there's another pulse in this packet, it extends to that pulse
-                    pulse_end_time = packet_pulses[j + 1].timestamp
-                else:
-                    # If this is the last pulse in the packet, it extends to the packet end
-                    pulse_end_time = packet_end_time
-
-                # Ensure we're within the visible time window
-                pulse_start_time = max(pulse_start_time, oldest_time)
-                pulse_end_time = min(pulse_end_time, newest_time)
-
-                # Skip if entirely outside window
-                if pulse_end_time <= oldest_time or pulse_start_time >= newest_time:
-                    continue
-
-                # Calculate positions and dimensions
-                time_position_start = (pulse_start_time - oldest_time) / time_span_sec
-                time_position_end = (pulse_end_time - oldest_time) / time_span_sec
-
-                x_start = 5 + (time_position_start * usable_width)
-                x_end = 5 + (time_position_end * usable_width)
-                rect_width = max(3, x_end - x_start)  # Minimum 3px, but allow full width to fill gaps
-
-                # Calculate height based on intensity (always define rect_height)
-                height_ratio = pulse.applied_intensity / scale_max if scale_max > 0 else 0
-                rect_height = height * height_ratio
-
-                # Get color based on frequency
-                pulse_color = self.get_color_for_frequency(pulse.frequency)
-
-                # For zero-intensity pulses, still show something to indicate timing
-                if pulse.applied_intensity <= 0:
-                    # Draw a thin line or empty rectangle to show timing without intensity
-                    empty_rect = QGraphicsRectItem(
-                        x_start, height - 2,  # Just a thin line at the bottom
-                        rect_width, 2
-                    )
-                    empty_rect.setBrush(QBrush(QColor(100, 100, 100, 50)))  # Almost transparent
-                    self.scene.addItem(empty_rect)
-                else:
-                    # Create simple rectangle for the pulse (no hover events for performance)
-                    rect = QGraphicsRectItem(
-                        x_start, height - rect_height,  # x, y (bottom-aligned)
-                        rect_width, rect_height         # width, height
-                    )
-                    rect.setBrush(QBrush(pulse_color))
-                    self.scene.addItem(rect)
+        # Bars are axis-aligned fills: no outline, and no antialiasing (QPainter's default)
+        painter.setPen(Qt.NoPen)
+
+        # One drawRects call per brush
+        for brush, rects in self._pulse_rects(width, height, now):
+            painter.setBrush(brush)
+            painter.drawRects(rects)
+        painter.end()
+
+    def _pulse_rects(self, width: int, height: int, now: float) -> list:
+        """Lay out the visible pulses, grouped by brush as [(brush, [QRectF, ...]), ...]"""
+        if self._cached_freq_range[0] is None:
+            self._rebuild_brush_cache()
+
+        x_start, y, rect_width, rect_height, color_index = _pulse_geometry(
+            self._timestamps[self._pulse_start:self._pulse_end],
+            self._frequencies[self._pulse_start:self._pulse_end],
+            self._applied_intensities[self._pulse_start:self._pulse_end],
+            now, self.time_window.get(), width, height, self.channel_limit,
+            self._cached_freq_range[0], len(self._brush_cache))
+        if not len(color_index):
+            return []
+
+        # Group rects by brush; only creating the QRectF objects is left per pulse
+        order = np.argsort(color_index, kind='stable')
+        color_index = color_index[order]
+        split_at = np.flatnonzero(np.diff(color_index)) + 1
+        columns = (x_start[order].tolist(), y[order].tolist(),
+                   rect_width[order].tolist(), rect_height[order].tolist())
+
+        groups = []
+        for lo, hi in zip([0, *split_at.tolist()], [*split_at.tolist(), len(order)]):
+            index = int(color_index[lo])
+            brush = self._empty_pulse_brush if index < 0 else self._brush_at(index)
+            rects = [QRectF(x, y, w, h) for x, y, w, h in zip(*(column[lo:hi] for column in columns))]
+            groups.append((brush, rects))
+        return groups
 
     def _update_background_brush(self):
         """Update background brush based on current theme."""
-        self.view.setBackgroundBrush(ThemeManager.instance().get_color('background_graphics'))
+        self._background_color = ThemeManager.instance().get_color('background_graphics')
 
+    @Slot(bool)
     def _on_theme_changed(self, is_dark: bool):
         """Handle theme change."""
+        # Only the background depends on the theme; skip the redraw if it is unchanged
+        previous_color = self._background_color
         self._update_background_brush()
-        self._dirty = True
+        if self._background_color != previous_color:
+            self._mark_dirty()
 
     def cleanup(self):
-        """Stop the timer to prevent errors on close"""
+        """Stop the timer and detach from the theme manager to prevent errors on close"""
         if self.timer:
             self.timer.stop()
             self.timer.deleteLater()
             self.timer = None
+            ThemeManager.instance().theme_changed.disconnect(self._on_theme_changed)
@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QWizardPage
+from PySide6.QtWidgets import QWizardPage, QButtonGroup
 
 from qt_ui.device_wizard.coyote_waveform_select_ui import Ui_WizardPageCoyote
 
@@ -46,26 +46,40 @@ class WizardPageCoyoteWaveformSelect(QWizardPage, Ui_WizardPageCoyote):
         super().__init__(parent)
         self.setupUi(self)
 
-        self.three_phase_radio.toggled.connect(self.completeChanged)
-        self.two_channel_radio.toggled.connect(self.completeChanged)
-        self.motion_algorithm_radio.toggled.connect(self.completeChanged)
-        self.three_phase_radio.toggled.connect(self._update_description)
-        self.two_channel_radio.toggled.connect(self._update_description)
-        self.motion_algorithm_radio.toggled.connect(self._update_description)
+        # Switching modes toggles two radios; the group lets us react once per switch
+        self.mode_group = QButtonGroup(self)
+        self.mode_group.addButton(self.three_phase_radio)
+        self.mode_group.addButton(self.two_channel_radio)
+        self.mode_group.addButton(self.motion_algorithm_radio)
+        self.mode_group.buttonToggled.connect(self._on_mode_toggled)
 
         # Set initial description
+        self._description = None
         self._update_description()
 
+    def _on_mode_toggled(self, button, checked: bool):
+        # Ignore the radio being switched off, the newly checked one follows
+        if not checked:
+            return
+        self._update_description()
+        self.completeChanged.emit()
+
     def _update_description(self):
         """Update the description label based on selected mode."""
         if self.three_phase_radio.isChecked():
-            self.label.setText(THREE_PHASE_DESCRIPTION)
+            description = THREE_PHASE_DESCRIPTION
         elif self.two_channel_radio.isChecked():
-            self.label.setText(TWO_CHANNEL_DESCRIPTION)
+            description = TWO_CHANNEL_DESCRIPTION
         elif self.motion_algorithm_radio.isChecked():
-            self.label.setText(MOTION_ALGORITHM_DESCRIPTION)
+            description = MOTION_ALGORITHM_DESCRIPTION
         else:
-            self.label.setText("Select a mode to see its description.")
+            description = "Select a mode to see its description."
+
+        # Switching modes toggles two radios; only lay out the rich text once per change
+        if description is self._description:
+            return
+        self._description = description
+        self.label.setText(description)
 
     def isComplete(self) -> bool:
         return any([
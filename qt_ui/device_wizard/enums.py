@@ -17,6 +17,14 @@ class DeviceType(Enum):
     COYOTE_MOTION_ALGORITHM = 10
 
 
+# Device types whose waveform settings are stored alongside the device type
+_DEVICES_WITH_WAVEFORM = frozenset({
+    DeviceType.AUDIO_THREE_PHASE, DeviceType.FOCSTIM_THREE_PHASE,
+    DeviceType.COYOTE_THREE_PHASE, DeviceType.COYOTE_TWO_CHANNEL,
+    DeviceType.COYOTE_MOTION_ALGORITHM,
+})
+
+
 class WaveformType(Enum):
     CONTINUOUS = 1
     PULSE_BASED = 2
@@ -33,9 +41,7 @@ class DeviceConfiguration:
 
     def save(self):
         settings.device_config_device_type.set(self.device_type.value)
-        if self.device_type in (DeviceType.AUDIO_THREE_PHASE, DeviceType.FOCSTIM_THREE_PHASE,
-                                DeviceType.COYOTE_THREE_PHASE, DeviceType.COYOTE_TWO_CHANNEL,
-                                DeviceType.COYOTE_MOTION_ALGORITHM):
+        if self.device_type in _DEVICES_WITH_WAVEFORM:
             settings.device_config_waveform_type.set(self.waveform_type.value)
             settings.device_config_min_freq.set(float(self.min_frequency))
             settings.device_config_max_freq.set(float(self.max_frequency))
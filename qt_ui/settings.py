@@ -18,15 +18,28 @@ class Setting:
 
     def get(self):
         if self.cache is None:
-            self.cache = get_settings_instance().value(self.key, self.default_value, self.dtype)
+            self.load(get_settings_instance())
         return self.cache
 
+    def load(self, qsettings: QSettings):
+        self.cache = qsettings.value(self.key, self.default_value, self.dtype)
+
     def set(self, value):
         if value != self.cache:
             get_settings_instance().setValue(self.key, value)
             self.cache = value
 
 
+def preload(*settings):
+    """Read several not-yet-cached settings through a single QSettings instance"""
+    qsettings = None
+    for setting in settings:
+        if setting.cache is None:
+            if qsettings is None:
+                qsettings = get_settings_instance()
+            setting.load(qsettings)
+
+
 class NonPersistentSetting:
     def __init__(self, default_value):
         self.value = default_value
@@ -246,14 +259,12 @@ class DictSetting(Setting):
     def __init__(self, key, default_value):
         super().__init__(key, default_value, str)
     
-    def get(self):
-        if self.cache is None:
-            json_str = get_settings_instance().value(self.key, json.dumps(self.default_value), str)
-            try:
-                self.cache = json.loads(json_str) if json_str else self.default_value
-            except (json.JSONDecodeError, TypeError):
-                self.cache = self.default_value
-        return self.cache
+    def load(self, qsettings: QSettings):
+        json_str = qsettings.value(self.key, json.dumps(self.default_value), str)
+        try:
+            self.cache = json.loads(json_str) if json_str else self.default_value
+        except (json.JSONDecodeError, TypeError):
+            self.cache = self.default_value
     
     def set(self, value):
         json_str = json.dumps(value)
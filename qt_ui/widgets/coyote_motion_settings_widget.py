@@ -1,8 +1,9 @@
+from functools import partial
 from typing import Optional
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
                              QLabel, QSlider, QCheckBox, QSpinBox,
                              QComboBox, QFrame)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Slot
 from qt_ui import settings
 
 # Tooltip strings for all controls
@@ -83,30 +84,87 @@ FREQ_ALGO_DESCRIPTIONS = {
     ),
 }
 
+# Dropdown entries, in display order
+FREQ_ALGORITHMS = tuple(FREQ_ALGO_DESCRIPTIONS)
+_BLEND_ALGORITHM = "Blend (Position + Noise)"
+# Algorithms with a noise component, which use the range slider
+_RANGE_ALGORITHMS = frozenset({"Varied (Noise-based)", _BLEND_ALGORITHM})
+
+
+# Label texts for the 0-100 slider positions, indexed by slider value
+_PERCENT_LABELS = tuple(f"{i}%" for i in range(101))
+_FRACTION_LABELS = tuple(f"{i/100:.2f}" for i in range(101))
+
+
+def _hint_label(text):
+    """Static explanatory text; it takes no part in mouse handling"""
+    label = QLabel(text)
+    label.setTextInteractionFlags(Qt.NoTextInteraction)
+    label.setAttribute(Qt.WA_TransparentForMouseEvents)
+    return label
+
+
+# Sliders and spinboxes that show a setting multiplied by a display scale:
+# (attribute name, setting, scale)
+_SCALED_CONTROLS = (
+    ('throbbing_intensity', settings.COYOTE_MOTION_THROBBING_INTENSITY, 100),
+    ('bottom_threshold', settings.COYOTE_MOTION_BOTTOM_REGION_THRESHOLD, 100),
+    ('upper_threshold', settings.COYOTE_MOTION_UPPER_REGION_THRESHOLD, 100),
+    ('velocity_factor', settings.COYOTE_MOTION_FREQUENCY_VELOCITY_FACTOR, 100),
+    ('velocity_timeframe', settings.COYOTE_MOTION_VELOCITY_TIMEFRAME, 1),
+    ('dynamic_sensitivity', settings.COYOTE_MOTION_DYNAMIC_SENSITIVITY, 100),
+    ('window_size', settings.COYOTE_MOTION_DYNAMIC_WINDOW_SIZE, 1),
+    ('mix_ratio', settings.COYOTE_MOTION_DYNAMIC_MIX_RATIO, 100),
+    ('base_amplitude', settings.COYOTE_MOTION_BASE_AMPLITUDE, 100),
+    ('extreme_boost', settings.COYOTE_MOTION_EXTREME_BOOST, 100),
+    # stored in seconds, displayed as milliseconds
+    ('fade_out_time', settings.COYOTE_MOTION_FADE_OUT_TIME, 1000),
+    ('fade_in_time', settings.COYOTE_MOTION_FADE_IN_TIME, 1000),
+    ('varied_range', settings.COYOTE_MOTION_VARIED_RANGE, 100),
+    ('blend_ratio', settings.COYOTE_MOTION_BLEND_RATIO, 100),
+)
+
 
 class CoyoteMotionSettingsWidget(QWidget):
     """UI settings for Coyote Motion Algorithm enhancement"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setup_ui()
-        self.bind_to_settings()
-        
+
+        # Slider drags and spinbox steps fire valueChanged continuously; the values are
+        # collected here and written to the (disk-backed) settings at most every 150ms
+        self._pending_settings = {}
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(150)
+        self._settings_timer.timeout.connect(self._flush_pending_settings)
+
+        # The controls are only built once the tab is first opened; the tab is hidden
+        # unless the Coyote motion algorithm device is configured
+        self._ui_built = False
+        # Algorithm whose description and sliders are currently shown
+        self._shown_algorithm = None
+
+    def showEvent(self, event):
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+            self.bind_to_settings()
+        super().showEvent(event)
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(6)
 
+        # Sliders with a single value label: slider -> (label, label texts)
+        self._value_labels = {}
+
         # Frequency Options (Algorithm + Velocity Factor)
         freq_group = QGroupBox("Frequency Options")
         freq_layout = QVBoxLayout(freq_group)
 
         self.frequency_algorithm = QComboBox()
-        self.frequency_algorithm.addItems([
-            "Position (Standard)",
-            "Varied (Noise-based)",
-            "Blend (Position + Noise)",
-            "Fixed (Constant)"
-        ])
+        self.frequency_algorithm.addItems(FREQ_ALGORITHMS)
         freq_layout.addWidget(QLabel("Algorithm:"))
         freq_layout.addWidget(self.frequency_algorithm)
 
@@ -127,6 +185,7 @@ class CoyoteMotionSettingsWidget(QWidget):
         varied_range_layout.addWidget(self.varied_range)
         self.varied_range_label = QLabel("30%")
         varied_range_layout.addWidget(self.varied_range_label)
+        self._value_labels[self.varied_range] = (self.varied_range_label, _PERCENT_LABELS)
         freq_layout.addWidget(self.varied_range_widget)
         self.varied_range_widget.setVisible(False)
 
@@ -150,15 +209,8 @@ class CoyoteMotionSettingsWidget(QWidget):
         # Velocity Factor (integrated into Frequency Options)
         freq_layout.addSpacing(10)
 
-        vel_factor_layout = QHBoxLayout()
-        vel_factor_layout.addWidget(QLabel("Velocity Factor:"))
-        self.velocity_factor = QSlider(Qt.Horizontal)
-        self.velocity_factor.setRange(0, 100)  # 0% to 100%
-        self.velocity_factor.setValue(50)
-        vel_factor_layout.addWidget(self.velocity_factor)
-        self.velocity_factor_label = QLabel("50%")
-        vel_factor_layout.addWidget(self.velocity_factor_label)
-        freq_layout.addLayout(vel_factor_layout)
+        self.velocity_factor, self.velocity_factor_label = self._add_slider_row(
+            freq_layout, "Velocity Factor:", 0, 100, 50, _PERCENT_LABELS)
 
         # Velocity timeframe setting
         timeframe_layout = QHBoxLayout()
@@ -167,11 +219,12 @@ class CoyoteMotionSettingsWidget(QWidget):
         self.velocity_timeframe.setRange(1, 60)  # 1 to 60 seconds
         self.velocity_timeframe.setValue(5)
         self.velocity_timeframe.setSuffix(" sec")
+        self.velocity_timeframe.setKeyboardTracking(False)
         timeframe_layout.addWidget(self.velocity_timeframe)
         timeframe_layout.addStretch()
         freq_layout.addLayout(timeframe_layout)
 
-        freq_layout.addWidget(QLabel("(Faster movement = higher pulse frequency)"))
+        freq_layout.addWidget(_hint_label("(Faster movement = higher pulse frequency)"))
 
         # Intensity Options (Regional Throbbing)
         self.intensity_group = QGroupBox("Intensity Options")
@@ -182,36 +235,14 @@ class CoyoteMotionSettingsWidget(QWidget):
         intensity_opts_layout.addWidget(self.throbbing_enabled)
 
         # Throbbing Intensity (reduction amount)
-        intensity_layout = QHBoxLayout()
-        intensity_layout.addWidget(QLabel("Intensity:"))
-        self.throbbing_intensity = QSlider(Qt.Horizontal)
-        self.throbbing_intensity.setRange(0, 100)
-        self.throbbing_intensity.setValue(30)
-        intensity_layout.addWidget(self.throbbing_intensity)
-        self.throbbing_intensity_label = QLabel("0.3")
-        intensity_layout.addWidget(self.throbbing_intensity_label)
-        intensity_opts_layout.addLayout(intensity_layout)
-        
+        self.throbbing_intensity, self.throbbing_intensity_label = self._add_slider_row(
+            intensity_opts_layout, "Intensity:", 0, 100, 30, _FRACTION_LABELS)
+
         # Region Thresholds
-        bottom_layout = QHBoxLayout()
-        bottom_layout.addWidget(QLabel("Bottom Region:"))
-        self.bottom_threshold = QSlider(Qt.Horizontal)
-        self.bottom_threshold.setRange(10, 50)
-        self.bottom_threshold.setValue(30)
-        bottom_layout.addWidget(self.bottom_threshold)
-        self.bottom_threshold_label = QLabel("30%")
-        bottom_layout.addWidget(self.bottom_threshold_label)
-        intensity_opts_layout.addLayout(bottom_layout)
-        
-        upper_layout = QHBoxLayout()
-        upper_layout.addWidget(QLabel("Upper Region:"))
-        self.upper_threshold = QSlider(Qt.Horizontal)
-        self.upper_threshold.setRange(50, 90)
-        self.upper_threshold.setValue(70)
-        upper_layout.addWidget(self.upper_threshold)
-        self.upper_threshold_label = QLabel("70%")
-        upper_layout.addWidget(self.upper_threshold_label)
-        intensity_opts_layout.addLayout(upper_layout)
+        self.bottom_threshold, self.bottom_threshold_label = self._add_slider_row(
+            intensity_opts_layout, "Bottom Region:", 10, 50, 30, _PERCENT_LABELS)
+        self.upper_threshold, self.upper_threshold_label = self._add_slider_row(
+            intensity_opts_layout, "Upper Region:", 50, 90, 70, _PERCENT_LABELS)
 
         # Visual separator between Regional Throbbing and Amplitude settings
         separator = QFrame()
@@ -222,27 +253,13 @@ class CoyoteMotionSettingsWidget(QWidget):
         intensity_opts_layout.addSpacing(4)
 
         # Base Amplitude slider
-        base_amp_layout = QHBoxLayout()
-        base_amp_layout.addWidget(QLabel("Base Amplitude:"))
-        self.base_amplitude = QSlider(Qt.Horizontal)
-        self.base_amplitude.setRange(0, 100)
-        self.base_amplitude.setValue(60)
-        base_amp_layout.addWidget(self.base_amplitude)
-        self.base_amplitude_label = QLabel("60%")
-        base_amp_layout.addWidget(self.base_amplitude_label)
-        intensity_opts_layout.addLayout(base_amp_layout)
+        self.base_amplitude, self.base_amplitude_label = self._add_slider_row(
+            intensity_opts_layout, "Base Amplitude:", 0, 100, 60, _PERCENT_LABELS)
 
         # Extreme Boost slider
-        extreme_boost_layout = QHBoxLayout()
-        extreme_boost_layout.addWidget(QLabel("Extreme Boost:"))
-        self.extreme_boost = QSlider(Qt.Horizontal)
-        self.extreme_boost.setRange(0, 100)
-        self.extreme_boost.setValue(30)
-        extreme_boost_layout.addWidget(self.extreme_boost)
-        self.extreme_boost_label = QLabel("30%")
-        extreme_boost_layout.addWidget(self.extreme_boost_label)
-        intensity_opts_layout.addLayout(extreme_boost_layout)
-        intensity_opts_layout.addWidget(QLabel("(Extra intensity at position extremes)"))
+        self.extreme_boost, self.extreme_boost_label = self._add_slider_row(
+            intensity_opts_layout, "Extreme Boost:", 0, 100, 30, _PERCENT_LABELS)
+        intensity_opts_layout.addWidget(_hint_label("(Extra intensity at position extremes)"))
 
         # Dynamic Volume Controls
         self.volume_group = QGroupBox("Dynamic Volume")
@@ -252,22 +269,16 @@ class CoyoteMotionSettingsWidget(QWidget):
         self.dynamic_volume_enabled.setChecked(True)
         volume_layout.addWidget(self.dynamic_volume_enabled)
         
-        sensitivity_layout = QHBoxLayout()
-        sensitivity_layout.addWidget(QLabel("Sensitivity:"))
-        self.dynamic_sensitivity = QSlider(Qt.Horizontal)
-        self.dynamic_sensitivity.setRange(0, 100)
-        self.dynamic_sensitivity.setValue(50)
-        sensitivity_layout.addWidget(self.dynamic_sensitivity)
-        self.sensitivity_label = QLabel("0.5")
-        sensitivity_layout.addWidget(self.sensitivity_label)
-        volume_layout.addLayout(sensitivity_layout)
-        
+        self.dynamic_sensitivity, self.sensitivity_label = self._add_slider_row(
+            volume_layout, "Sensitivity:", 0, 100, 50, _FRACTION_LABELS)
+
         window_layout = QHBoxLayout()
         window_layout.addWidget(QLabel("Time Window:"))
         self.window_size = QSpinBox()
         self.window_size.setRange(1, 300)  # Up to 5 minutes
         self.window_size.setValue(2)
         self.window_size.setSuffix(" sec")
+        self.window_size.setKeyboardTracking(False)
         window_layout.addWidget(self.window_size)
         window_layout.addStretch()
         volume_layout.addLayout(window_layout)
@@ -285,13 +296,13 @@ class CoyoteMotionSettingsWidget(QWidget):
         self.mix_ratio_label = QLabel("50%")
         mix_layout.addWidget(self.mix_ratio_label)
         volume_layout.addLayout(mix_layout)
-        volume_layout.addWidget(QLabel("(Balance between stroke count and velocity detection)"))
+        volume_layout.addWidget(_hint_label("(Balance between stroke count and velocity detection)"))
 
         # Pause Fade Controls
         fade_group = QGroupBox("Pause Fade")
         fade_layout = QVBoxLayout(fade_group)
 
-        fade_layout.addWidget(QLabel("Smooth fade when movement stops/starts"))
+        fade_layout.addWidget(_hint_label("Smooth fade when movement stops/starts"))
 
         # Fade out time
         fade_out_layout = QHBoxLayout()
@@ -301,6 +312,7 @@ class CoyoteMotionSettingsWidget(QWidget):
         self.fade_out_time.setSingleStep(50)
         self.fade_out_time.setValue(300)
         self.fade_out_time.setSuffix(" ms")
+        self.fade_out_time.setKeyboardTracking(False)
         fade_out_layout.addWidget(self.fade_out_time)
         fade_out_layout.addStretch()
         fade_layout.addLayout(fade_out_layout)
@@ -313,6 +325,7 @@ class CoyoteMotionSettingsWidget(QWidget):
         self.fade_in_time.setSingleStep(50)
         self.fade_in_time.setValue(100)
         self.fade_in_time.setSuffix(" ms")
+        self.fade_in_time.setKeyboardTracking(False)
         fade_in_layout.addWidget(self.fade_in_time)
         fade_in_layout.addStretch()
         fade_layout.addLayout(fade_in_layout)
@@ -325,57 +338,47 @@ class CoyoteMotionSettingsWidget(QWidget):
         layout.addStretch()
 
         # Connect signals
-        self.throbbing_intensity.valueChanged.connect(self.update_throbbing_labels)
-        self.bottom_threshold.valueChanged.connect(self.update_region_labels)
-        self.upper_threshold.valueChanged.connect(self.update_region_labels)
-        self.dynamic_sensitivity.valueChanged.connect(self.update_sensitivity_label)
-        self.velocity_factor.valueChanged.connect(self.update_velocity_factor_label)
-        self.base_amplitude.valueChanged.connect(self.update_amplitude_labels)
-        self.extreme_boost.valueChanged.connect(self.update_amplitude_labels)
+        for slider in self._value_labels:
+            slider.valueChanged.connect(self._on_labeled_value_changed)
         self.mix_ratio.valueChanged.connect(self.update_mix_ratio_label)
-        self.frequency_algorithm.currentTextChanged.connect(self._update_algorithm_description)
-        self.varied_range.valueChanged.connect(self._update_varied_range_label)
+        self.frequency_algorithm.currentTextChanged.connect(self._on_algorithm_changed)
         self.blend_ratio.valueChanged.connect(self._update_blend_ratio_label)
 
         # Apply tooltips and initialize description
         self._apply_tooltips()
         self._update_algorithm_description()
         
-    def update_throbbing_labels(self, value):
-        """Update throbbing intensity label"""
-        self.throbbing_intensity_label.setText(f"{value/100:.2f}")
-        
-    def update_region_labels(self):
-        """Update region threshold labels"""
-        self.bottom_threshold_label.setText(f"{self.bottom_threshold.value()}%")
-        self.upper_threshold_label.setText(f"{self.upper_threshold.value()}%")
-        
-    def update_sensitivity_label(self, value):
-        """Update sensitivity label"""
-        self.sensitivity_label.setText(f"{value/100:.2f}")
-
-    def update_velocity_factor_label(self, value):
-        """Update velocity factor label"""
-        self.velocity_factor_label.setText(f"{value}%")
-
-    def update_amplitude_labels(self):
-        """Update base amplitude and extreme boost labels"""
-        self.base_amplitude_label.setText(f"{self.base_amplitude.value()}%")
-        self.extreme_boost_label.setText(f"{self.extreme_boost.value()}%")
+    def _add_slider_row(self, layout, caption, minimum, maximum, value, texts):
+        """Add a 'caption: slider value' row to layout and return the slider and value label"""
+        row = QHBoxLayout()
+        row.addWidget(QLabel(caption))
+        slider = QSlider(Qt.Horizontal)
+        slider.setRange(minimum, maximum)
+        slider.setValue(value)
+        row.addWidget(slider)
+        label = QLabel(texts[value])
+        row.addWidget(label)
+        layout.addLayout(row)
+        self._value_labels[slider] = (label, texts)
+        return slider, label
+
+    @Slot(int)
+    def _on_labeled_value_changed(self, value):
+        self._set_value_label(self.sender(), value)
+
+    def _set_value_label(self, slider, value):
+        label, texts = self._value_labels[slider]
+        label.setText(texts[value])
 
     def update_mix_ratio_label(self, value):
         """Update mix ratio labels (strokes and velocity)"""
-        self.mix_ratio_label.setText(f"{value}%")
-        self.strokes_ratio_label.setText(f"{100 - value}%")
-
-    def _update_varied_range_label(self, value):
-        """Update varied range label"""
-        self.varied_range_label.setText(f"{value}%")
+        self.mix_ratio_label.setText(_PERCENT_LABELS[value])
+        self.strokes_ratio_label.setText(_PERCENT_LABELS[100 - value])
 
     def _update_blend_ratio_label(self, value):
         """Update blend ratio labels"""
-        self.blend_noise_label.setText(f"{value}%")
-        self.blend_position_label.setText(f"{100 - value}%")
+        self.blend_noise_label.setText(_PERCENT_LABELS[value])
+        self.blend_position_label.setText(_PERCENT_LABELS[100 - value])
 
     def setup_device(self, device):
         """Setup connection to Coyote device (for Motion Algorithm)"""
@@ -384,95 +387,65 @@ class CoyoteMotionSettingsWidget(QWidget):
 
     def bind_to_settings(self):
         """Bind all controls to settings"""
+        # Load the stored values with signals blocked, so the label slots don't fire
+        # once per control; the labels are refreshed in one go below
+        scaled_controls = [(getattr(self, name), setting, scale) for name, setting, scale in _SCALED_CONTROLS]
+        controls = [self.frequency_algorithm, self.throbbing_enabled, self.dynamic_volume_enabled]
+        controls += [control for control, _, _ in scaled_controls]
+        for control in controls:
+            control.blockSignals(True)
+
+        # Read everything below from the settings file in one pass
+        settings.preload(
+            settings.COYOTE_MOTION_FREQUENCY_ALGORITHM, settings.COYOTE_MOTION_THROBBING_ENABLED,
+            settings.COYOTE_MOTION_DYNAMIC_VOLUME_ENABLED,
+            *(setting for _, setting, _ in _SCALED_CONTROLS),
+        )
+
         # Frequency algorithm
         current_algorithm = settings.COYOTE_MOTION_FREQUENCY_ALGORITHM.get()
         index = self.frequency_algorithm.findText(current_algorithm)
         if index >= 0:
             self.frequency_algorithm.setCurrentIndex(index)
-            
-        # Throbbing settings
-        self.throbbing_enabled.setChecked(settings.COYOTE_MOTION_THROBBING_ENABLED.get())
-        self.throbbing_intensity.setValue(int(settings.COYOTE_MOTION_THROBBING_INTENSITY.get() * 100))
-        self.bottom_threshold.setValue(int(settings.COYOTE_MOTION_BOTTOM_REGION_THRESHOLD.get() * 100))
-        self.upper_threshold.setValue(int(settings.COYOTE_MOTION_UPPER_REGION_THRESHOLD.get() * 100))
-        
-        # Velocity-to-frequency settings
-        self.velocity_factor.setValue(int(settings.COYOTE_MOTION_FREQUENCY_VELOCITY_FACTOR.get() * 100))
-        self.velocity_timeframe.setValue(int(settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.get()))
 
-        # Dynamic volume settings
+        self.throbbing_enabled.setChecked(settings.COYOTE_MOTION_THROBBING_ENABLED.get())
         self.dynamic_volume_enabled.setChecked(settings.COYOTE_MOTION_DYNAMIC_VOLUME_ENABLED.get())
-        self.dynamic_sensitivity.setValue(int(settings.COYOTE_MOTION_DYNAMIC_SENSITIVITY.get() * 100))
-        self.window_size.setValue(int(settings.COYOTE_MOTION_DYNAMIC_WINDOW_SIZE.get()))
-        self.mix_ratio.setValue(int(settings.COYOTE_MOTION_DYNAMIC_MIX_RATIO.get() * 100))
-        
+        for control, setting, scale in scaled_controls:
+            control.setValue(round(setting.get() * scale))
+
+        for control in controls:
+            control.blockSignals(False)
+
+        # Bring the labels and algorithm description in line with the loaded values
+        for slider in self._value_labels:
+            self._set_value_label(slider, slider.value())
+        self.update_mix_ratio_label(self.mix_ratio.value())
+        self._update_blend_ratio_label(self.blend_ratio.value())
+        self._update_algorithm_description()
+
         # Connect change signals to save settings
-        self.frequency_algorithm.currentTextChanged.connect(
-            lambda text: settings.COYOTE_MOTION_FREQUENCY_ALGORITHM.set(text)
-        )
         self.throbbing_enabled.toggled.connect(
             settings.COYOTE_MOTION_THROBBING_ENABLED.set
         )
-        self.throbbing_intensity.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_THROBBING_INTENSITY.set(value / 100.0)
-        )
-        self.bottom_threshold.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_BOTTOM_REGION_THRESHOLD.set(value / 100.0)
-        )
-        self.upper_threshold.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_UPPER_REGION_THRESHOLD.set(value / 100.0)
-        )
-        self.velocity_factor.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_FREQUENCY_VELOCITY_FACTOR.set(value / 100.0)
-        )
-        self.velocity_timeframe.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.set(float(value))
-        )
         self.dynamic_volume_enabled.toggled.connect(
             settings.COYOTE_MOTION_DYNAMIC_VOLUME_ENABLED.set
         )
-        self.dynamic_sensitivity.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_DYNAMIC_SENSITIVITY.set(value / 100.0)
-        )
-        self.window_size.valueChanged.connect(
-            settings.COYOTE_MOTION_DYNAMIC_WINDOW_SIZE.set
-        )
-        self.mix_ratio.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_DYNAMIC_MIX_RATIO.set(value / 100.0)
-        )
+        for control, setting, scale in scaled_controls:
+            control.valueChanged.connect(partial(self._schedule_scaled_setting, setting, scale))
 
-        # Amplitude settings
-        self.base_amplitude.setValue(int(settings.COYOTE_MOTION_BASE_AMPLITUDE.get() * 100))
-        self.extreme_boost.setValue(int(settings.COYOTE_MOTION_EXTREME_BOOST.get() * 100))
+    def _schedule_scaled_setting(self, setting: settings.Setting, scale, value):
+        self._schedule_setting(setting, value / scale)
 
-        self.base_amplitude.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_BASE_AMPLITUDE.set(value / 100.0)
-        )
-        self.extreme_boost.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_EXTREME_BOOST.set(value / 100.0)
-        )
-
-        # Fade settings (stored in seconds, displayed as milliseconds)
-        self.fade_out_time.setValue(int(settings.COYOTE_MOTION_FADE_OUT_TIME.get() * 1000))
-        self.fade_in_time.setValue(int(settings.COYOTE_MOTION_FADE_IN_TIME.get() * 1000))
-
-        self.fade_out_time.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_FADE_OUT_TIME.set(value / 1000.0)
-        )
-        self.fade_in_time.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_FADE_IN_TIME.set(value / 1000.0)
-        )
+    def _schedule_setting(self, setting: settings.Setting, value):
+        """Queue a settings write; the latest value per setting is written on the next flush"""
+        self._pending_settings[setting] = value
+        if not self._settings_timer.isActive():
+            self._settings_timer.start()
 
-        # Algorithm-specific settings
-        self.varied_range.setValue(int(settings.COYOTE_MOTION_VARIED_RANGE.get() * 100))
-        self.blend_ratio.setValue(int(settings.COYOTE_MOTION_BLEND_RATIO.get() * 100))
-
-        self.varied_range.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_VARIED_RANGE.set(value / 100.0)
-        )
-        self.blend_ratio.valueChanged.connect(
-            lambda value: settings.COYOTE_MOTION_BLEND_RATIO.set(value / 100.0)
-        )
+    def _flush_pending_settings(self):
+        pending, self._pending_settings = self._pending_settings, {}
+        for setting, value in pending.items():
+            setting.set(value)
 
     def _apply_tooltips(self):
         """Apply tooltip text to all controls"""
@@ -501,17 +474,29 @@ class CoyoteMotionSettingsWidget(QWidget):
         self.fade_out_time.setToolTip(TOOLTIP_FADE_OUT_TIME)
         self.fade_in_time.setToolTip(TOOLTIP_FADE_IN_TIME)
 
+    @Slot(str)
+    def _on_algorithm_changed(self, text):
+        self._update_algorithm_description()
+        settings.COYOTE_MOTION_FREQUENCY_ALGORITHM.set(text)
+
     def _update_algorithm_description(self):
         """Update the description label and show/hide algorithm-specific sliders"""
         selected = self.frequency_algorithm.currentText()
+        # Called from setup_ui, bind_to_settings and on every change; skip if nothing changed
+        if selected == self._shown_algorithm:
+            return
+        self._shown_algorithm = selected
+
         description = FREQ_ALGO_DESCRIPTIONS.get(selected, "")
         self.frequency_algorithm_description.setText(description)
 
         # Show/hide algorithm-specific sliders
         # Range slider visible for both Varied and Blend (since Blend uses the noise component)
-        self.varied_range_widget.setVisible("Varied" in selected or "Blend" in selected)
-        self.blend_ratio_widget.setVisible("Blend" in selected)
+        self.varied_range_widget.setVisible(selected in _RANGE_ALGORITHMS)
+        self.blend_ratio_widget.setVisible(selected == _BLEND_ALGORITHM)
 
     def cleanup(self):
         """Cleanup resources when closing"""
-        pass
\ No newline at end of file
+        # Don't lose a change made just before closing
+        self._settings_timer.stop()
+        self._flush_pending_settings()
\ No newline at end of file
@@ -9,7 +9,7 @@ Only visible when in Coyote Motion Algorithm mode.
 """
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsTextItem
+from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsTextItem, QGraphicsItem
 from PySide6.QtGui import QColor, QPen, QBrush, QFont, QPainter
 
 from qt_ui.theme_manager import ThemeManager
@@ -32,6 +32,9 @@ class CoyoteMotionVisualizationWidget(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
         self.scene = QGraphicsScene()
+        # A handful of items, one of which moves on every update: the BSP index
+        # would be rebuilt on each move without ever paying off
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
         self._update_background_brush()
 
@@ -80,6 +83,8 @@ class CoyoteMotionVisualizationWidget(QGraphicsView):
         # Center the label above the bar
         text_width = self.label_top.boundingRect().width()
         self.label_top.setPos(-text_width / 2, -self._bar_height / 2 - 25)
+        # Static text: rasterize once instead of laying it out on every repaint
+        self.label_top.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.scene.addItem(self.label_top)
 
         # Bottom label (below the bar)
@@ -89,6 +94,7 @@ class CoyoteMotionVisualizationWidget(QGraphicsView):
         # Center the label below the bar
         text_width = self.label_bottom.boundingRect().width()
         self.label_bottom.setPos(-text_width / 2, self._bar_height / 2 + 5)
+        self.label_bottom.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.scene.addItem(self.label_bottom)
 
     def _create_position_bar(self):
@@ -154,7 +160,7 @@ class CoyoteMotionVisualizationWidget(QGraphicsView):
 
     def _update_background_brush(self):
         """Update background brush based on current theme."""
-        self.setBackgroundBrush(ThemeManager.instance().get_color('background_graphics'))
+        self.setBackgroundBrush(ThemeManager.instance().get_brush('background_graphics'))
 
     def _on_theme_changed(self, is_dark: bool):
         """Handle theme change by updating colors."""
@@ -10,7 +10,7 @@ Center = Equal intensity on both channels.
 """
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem
+from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem, QGraphicsItem
 from PySide6.QtGui import QColor, QPen, QFont, QPainter, QMouseEvent
 
 from qt_ui.theme_manager import ThemeManager
@@ -34,6 +34,9 @@ class CoyoteThreePhaseWidget(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
         self.scene = QGraphicsScene()
+        # A handful of items, one of which moves on every update: the BSP index
+        # would be rebuilt on each move without ever paying off
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
         self._update_background_brush()
 
@@ -107,6 +110,8 @@ class CoyoteThreePhaseWidget(QGraphicsView):
         self.label_a.setDefaultTextColor(ThemeManager.instance().get_color('text_secondary'))
         # Position below the left end
         self.label_a.setPos(-self._scale - 5, 15)
+        # Static text: rasterize once instead of laying it out on every repaint
+        self.label_a.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.scene.addItem(self.label_a)
 
         # Channel B label (right side - dominant when alpha = +1)
@@ -115,6 +120,7 @@ class CoyoteThreePhaseWidget(QGraphicsView):
         self.label_b.setDefaultTextColor(ThemeManager.instance().get_color('text_secondary'))
         # Position below the right end
         self.label_b.setPos(self._scale - 8, 15)
+        self.label_b.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.scene.addItem(self.label_b)
 
     def _create_dot(self):
@@ -184,7 +190,7 @@ class CoyoteThreePhaseWidget(QGraphicsView):
 
     def _update_background_brush(self):
         """Update background brush based on current theme."""
-        self.setBackgroundBrush(ThemeManager.instance().get_color('background_graphics'))
+        self.setBackgroundBrush(ThemeManager.instance().get_brush('background_graphics'))
 
     def _on_theme_changed(self, is_dark: bool):
         """Handle theme change by updating colors."""
@@ -111,7 +111,7 @@ class ThreephaseWidgetBase(QtWidgets.QGraphicsView):
 
     def _update_background_brush(self):
         """Update background brush based on current theme."""
-        self.setBackgroundBrush(ThemeManager.instance().get_color('background_graphics'))
+        self.setBackgroundBrush(ThemeManager.instance().get_brush('background_graphics'))
 
     def _on_theme_changed(self, is_dark: bool):
         """Handle theme change."""
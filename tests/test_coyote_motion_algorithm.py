@@ -3,6 +3,7 @@ import numpy as np
 from device.coyote.motion_algorithm import CoyoteMotionAlgorithm
 from stim_math.audio_gen.params import CoyoteMotionAlgorithmParams
 from funscript.funscript import Funscript
+from stim_math.axis import Timeline, WriteProtectedAxis, LinearInterpolator, DummyTimestampMapper
 
 
 class TestCoyoteMotionAlgorithm(unittest.TestCase):
@@ -14,7 +15,7 @@ class TestCoyoteMotionAlgorithm(unittest.TestCase):
         test_times = [0, 1, 2, 3, 4]  # 1 second intervals
         self.test_funscript = Funscript(test_times, test_positions)
         
-    def _create_test_algorithm(self):
+    def _create_test_algorithm(self, alpha=None):
         """Helper to create test algorithm with mock parameters"""
         from stim_math.axis import create_constant_axis
         from stim_math.audio_gen.params import (
@@ -33,7 +34,7 @@ class TestCoyoteMotionAlgorithm(unittest.TestCase):
             media=None,  # Not used in these tests
             params=CoyoteMotionAlgorithmParams(
                 position=ThreephasePositionParams(
-                    alpha=create_constant_axis(self.test_funscript.x),
+                    alpha=alpha if alpha is not None else create_constant_axis(self.test_funscript.x),
                     beta=create_constant_axis(np.zeros_like(self.test_funscript.x))
                 ),
                 transform=None,  # Not used in these tests
@@ -84,6 +85,18 @@ class TestCoyoteMotionAlgorithm(unittest.TestCase):
         
         return algorithm
         
+    def _create_funscript_algorithm(self, times, positions):
+        """Helper to create test algorithm with an alpha axis following the given funscript"""
+        alpha = WriteProtectedAxis(Timeline(times, positions), LinearInterpolator(), DummyTimestampMapper())
+        return self._create_test_algorithm(alpha)
+
+    def _create_random_stroke_algorithm(self, seed, count):
+        """Helper to create test algorithm on a random funscript; returns (algorithm, times)"""
+        rng = np.random.default_rng(seed)
+        times = np.cumsum(rng.uniform(0.05, 0.6, count))
+        positions = rng.uniform(-1.0, 1.0, count)
+        return self._create_funscript_algorithm(times, positions), times
+
     def test_motion_amplitude_calculation(self):
         """Test velocity/acceleration-based amplitude calculation"""
         algorithm = self._create_test_algorithm()
@@ -157,7 +170,8 @@ class TestCoyoteMotionAlgorithm(unittest.TestCase):
         ]
         
         for position, channel, min_freq, max_freq in test_cases:
-            freq = algorithm._calculate_enhanced_frequency(position, 0.0, channel)
+            freq_a, freq_b = algorithm._calculate_enhanced_frequencies(position, 0.0)
+            freq = freq_a if channel == 'A' else freq_b
             
             # Frequency should be within user-defined bounds
             self.assertGreaterEqual(freq, min_freq)
@@ -182,6 +196,69 @@ class TestCoyoteMotionAlgorithm(unittest.TestCase):
         self.assertEqual(len(algorithm.velocity_data), len(self.test_funscript.x))
         self.assertEqual(len(algorithm.acceleration_data), len(self.test_funscript.x))
         
+    def test_position_velocity_acceleration_lookup(self):
+        """Test interpolation against a funscript-backed alpha axis"""
+        times = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+        positions = np.array([-1.0, 0.0, 1.0, 0.0, -1.0])
+        algorithm = self._create_funscript_algorithm(times, positions)
+
+        self.assertTrue(algorithm.has_funscript_data())
+        velocities = np.gradient(positions, times)
+        accelerations = np.gradient(velocities, times)
+        for t in [0.0, 0.5, 1.25, 2.0, 3.75, 4.0, 10.0]:
+            pos, vel, acc = algorithm._get_position_velocity_acceleration(t)
+            self.assertAlmostEqual(pos, np.interp(t, times, positions), places=9)
+            self.assertAlmostEqual(vel, np.interp(t, times, velocities), places=9)
+            self.assertAlmostEqual(acc, np.interp(t, times, accelerations), places=9)
+
+    def test_average_velocity_in_window(self):
+        """Test windowed average stroke velocity against a direct overlap scan"""
+        from qt_ui import settings
+
+        algorithm, times = self._create_random_stroke_algorithm(1234, 200)
+        self.assertGreater(len(algorithm.stroke_data), 2)
+
+        half_window = settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.get() / 2.0
+        for t in np.linspace(times[0] - 2 * half_window, times[-1] + 2 * half_window, 50):
+            velocities = [s[4] for s in algorithm.stroke_data
+                          if s[0] <= t + half_window and s[1] >= t - half_window]
+            expected = sum(velocities) / len(velocities) if velocities else 0.0
+            self.assertAlmostEqual(algorithm._get_average_velocity_in_window(t), expected, places=9)
+
+    def test_stroke_velocity_at_time(self):
+        """Test stroke lookup against a direct scan of the stroke list"""
+        algorithm, times = self._create_random_stroke_algorithm(99, 100)
+
+        query_times = np.concatenate((np.linspace(times[0] - 1.0, times[-1] + 1.0, 300), times))
+        for t in query_times:
+            matching = [s[4] for s in algorithm.stroke_data if s[0] <= t <= s[1]]
+            if matching:
+                expected = matching[0]
+            elif t < algorithm.stroke_data[0][0]:
+                expected = algorithm.stroke_data[0][4]
+            else:
+                expected = algorithm.stroke_data[-1][4]
+            self.assertEqual(algorithm._get_stroke_velocity_at_time(t), expected)
+
+    def test_velocity_recalibration(self):
+        """Test calibrated max speed against a direct sliding-window scan"""
+        from qt_ui import settings
+
+        algorithm, times = self._create_random_stroke_algorithm(4321, 300)
+
+        window = min(settings.COYOTE_MOTION_VELOCITY_TIMEFRAME.get(), (times[-1] - times[0]) / 4)
+        window_averages = []
+        current_time = times[0]
+        while current_time <= times[-1]:
+            velocities = [s[4] for s in algorithm.stroke_data
+                          if s[0] <= current_time + window / 2 and s[1] >= current_time - window / 2]
+            if velocities:
+                window_averages.append(sum(velocities) / len(velocities))
+            current_time += window / 2
+
+        expected = max(np.percentile(window_averages, 95), 0.5)
+        self.assertAlmostEqual(algorithm.calibrated_max_speed, expected, places=9)
+
     def test_algorithm_integration(self):
         """Test complete algorithm integration"""
         algorithm = self._create_test_algorithm()